@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union, Unpack
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type, Union, Unpack
 
 from pydantic.fields import FieldInfo, _FromFieldInfoInputs
 
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 __all__ = ["Column"]
 
 class pganticsFieldInfo(FieldInfo):
+    __slots__ = ('_type',)
+
     def __init__(self, *,
         type: Union[Type[PostgresType], PostgresType]=MISSING,
         default: Any = MISSING,
@@ -25,30 +28,51 @@ class pganticsFieldInfo(FieldInfo):
             super().__init__(default=default, **kwargs)
 
 class ColumnInfo(pganticsFieldInfo, Expression):
+    __slots__ = ('sql_data', '_source_table', '_source_field', '_qualified', '_set_fragment')
+
+    _needs_parens = False
+
     def __init__(self, *,
         type: Union[Type[PostgresType], PostgresType]=MISSING,
         primary_key: bool = False,
         default: Any = MISSING,
         **kwargs: Unpack[_FromFieldInfoInputs]
     ):
-        super().__init__(default=default, **kwargs)
+        super().__init__(type=type, default=default, **kwargs)
 
         self.sql_data: Dict[str, Any] = {}
 
         self._source_table: Type[Table] = MISSING
         self._source_field: str = MISSING
+        self._qualified: str = MISSING
+        self._set_fragment: str = MISSING
 
         if primary_key:
             self.sql_data['primary_key'] = True
 
-    def build(self) -> Tuple[str, List[Any]]:
-        return f"{self._source_table.Meta.table_name}.{self._source_field}", []
+    def _bind(self, table: Type['Table'], name: str) -> None:
+        """Attach this column to its table. Called once by the table metaclass."""
+        self._source_table = table
+        self._source_field = sys.intern(name)
+        self._qualified = sys.intern(f"{table.Meta.table_name}.{name}")
+        self._set_fragment = sys.intern(f"{name} = %s")
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        return self._qualified
     
     def __str__(self) -> str:
-        return f"{self._source_table.Meta.table_name}.{self._source_field}"
+        return self._qualified
 
     def __hash__(self) -> int:
-        return hash((self._source_table.Meta.table_name, self._source_field))
+        return hash(self._qualified)
+
+    def __repr_args__(self) -> Iterable[Tuple[Optional[str], Any]]:
+        # FieldInfo's repr walks `type(self).__slots__`, which are the column's internals here.
+        # Repr a plain FieldInfo copy instead so only the field settings show.
+        field = FieldInfo.__new__(FieldInfo)
+        for name in FieldInfo.__slots__:
+            setattr(field, name, getattr(self, name))
+        return field.__repr_args__()
 
 def Column(
     type: Union[Type[PostgresType], PostgresType]=MISSING,
@@ -1,7 +1,10 @@
+import sys
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from typing import Any, List, Optional, Sequence, Tuple, Union
 
-from ..enums import BinaryOperator, Operator, Order
+from ..enums import BINARY_OPERATOR_SQL, OPERATOR_SQL, ORDER_SQL, BinaryOperator, Operator, Order
+from ..utils import placeholders
 
 __all__ = [
     'funcs',
@@ -9,34 +12,78 @@ __all__ = [
     'literal',
     'null',
     'case',
-    'func'
+    'func',
+    'param'
 ]
 
+# Keyword fragments spliced into rendered SQL, interned once at import time
+_AND = sys.intern('AND')
+_OR = sys.intern('OR')
+_AS = sys.intern(' AS ')
+_NOT = sys.intern('NOT (')
+_FILTER = sys.intern(' FILTER (WHERE ')
+_OVER = sys.intern(' OVER (')
+
+# Operators rendered after the left operand with no right-hand side
+_POSTFIX_OPERATORS = frozenset((Operator.IS_NULL, Operator.IS_NOT_NULL))
+
 class BaseExpression(ABC):
     """Abstract base class for all SQL expressions."""
+
+    __slots__ = ()
+
+    # Marker checked by to_expression(); cheaper than an isinstance() against this ABC
+    _is_expression: bool = True
+
+    # Whether the rendered SQL must be parenthesized when combined with other clauses
+    _needs_parens: bool = True
+
+    # Nodes that never change after construction memoize their build() output.
+    # Builder-style nodes (e.g. CASE) opt out, and so does anything built on top of them.
+    _cacheable: bool = True
+    _built: Optional[Tuple[str, Tuple[Any, ...]]] = None
     
     @abstractmethod
     def __init__(self):
         pass
 
-    @abstractmethod
     def build(self) -> Tuple[str, List[Any]]:
         """Build SQL string and parameter list."""
+        params: List[Any] = []
+        sql = self._build_into(params)
+        return sql, params
+
+    @abstractmethod
+    def _build_into(self, out_params: List[Any]) -> str:
+        """Build SQL string, extending `out_params` with this node's parameters."""
         pass
 
     def __str__(self) -> str:
-        sql, _ = self.build()
-        return f"{self.__class__.__name__}({sql})"
+        if self._built is not None:
+            return self._built[0]
+        return self._build_into([])
+
+    def __repr__(self) -> str:
+        try:
+            return f"{self.__class__.__name__}({self})"
+        except (TypeError, ValueError):
+            # Half-built nodes (e.g. a CASE with no WHEN yet) can't render, repr must still work
+            return f"{self.__class__.__name__}(<unbuildable>)"
+
+    def _memoize(self, sql: str, out_params: List[Any], start: int) -> str:
+        """Store a freshly built result on cacheable nodes and return its SQL.
+
+        `start` is the length of `out_params` before this node added its parameters.
+        """
+        if self._cacheable:
+            self._built = (sql, tuple(out_params[start:]))
+        return sql
     
 class Expression(BaseExpression):
-    """Base concrete expression class with operator overloading."""
-    
-    def __init__(self, sql: Optional[str] = None, params: Optional[List[Any]] = None):
-        self.sql = sql or str()
-        self.params = params or []
-    
-    def build(self) -> Tuple[str, List[Any]]:
-        return self.sql, self.params.copy()
+    """Base expression class with operator overloading."""
+
+    # Left empty so that ColumnInfo can combine this with pydantic's slotted FieldInfo
+    __slots__ = ()
     
     def as_alias(self, alias: str) -> 'Alias':
         """Create an aliased version of this expression."""
@@ -108,8 +155,7 @@ class Expression(BaseExpression):
             if not values:
                 # Empty IN clause should be FALSE
                 return Condition(LiteralExpression('1'), Operator.EQ, LiteralExpression('0'))
-            placeholders = ', '.join(['%s'] * len(values))
-            return Condition(self, Operator.IN, Expression(f'({placeholders})', list(values)))
+            return Condition(self, Operator.IN, RawExpression(f'({placeholders(len(values))})', list(values)))
         else:
             raise TypeError(f"IN operator requires a sequence or expression, got {type(values)}")
 
@@ -121,8 +167,7 @@ class Expression(BaseExpression):
             if not values:
                 # Empty NOT IN clause should be TRUE
                 return Condition(LiteralExpression('1'), Operator.EQ, LiteralExpression('1'))
-            placeholders = ', '.join(['%s'] * len(values))
-            return Condition(self, Operator.NOT_IN, Expression(f'({placeholders})', list(values)))
+            return Condition(self, Operator.NOT_IN, RawExpression(f'({placeholders(len(values))})', list(values)))
         else:
             raise TypeError(f"NOT IN operator requires a sequence or expression, got {type(values)}")
 
@@ -136,21 +181,22 @@ class Expression(BaseExpression):
     
     def is_null(self) -> 'Condition':
         """IS NULL check."""
-        return Condition(self, Operator.IS_NULL, NullExpression())
+        return Condition(self, Operator.IS_NULL, _NULL)
 
     def is_not_null(self) -> 'Condition':
         """IS NOT NULL check."""
-        return Condition(self, Operator.IS_NOT_NULL, NullExpression())
+        return Condition(self, Operator.IS_NOT_NULL, _NULL)
     
     def between(self, start: Any, end: Any) -> 'Condition':
         """BETWEEN operator."""
         start_expr = to_expression(start)
         end_expr = to_expression(end)
 
-        start_sql, start_params = start_expr.build()
-        end_sql, end_params = end_expr.build()
+        params = []
+        start_sql = start_expr._build_into(params)
+        end_sql = end_expr._build_into(params)
         
-        between_value = Expression(f'{start_sql} AND {end_sql}', start_params + end_params)
+        between_value = RawExpression(f'{start_sql} AND {end_sql}', params)
         return Condition(self, Operator.BETWEEN, between_value)
     
     def not_between(self, start: Any, end: Any) -> 'NotCondition':
@@ -175,138 +221,235 @@ class Expression(BaseExpression):
         """Unary plus (+expression)."""
         return UnaryExpression('+', self)
 
+class RawExpression(Expression):
+    """Expression for a raw SQL fragment with its parameters."""
+
+    __slots__ = ('sql', 'params')
+
+    def __init__(self, sql: Optional[str] = None, params: Optional[List[Any]] = None):
+        self.sql = sql or str()
+        self.params = params or []
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        out_params.extend(self.params)
+        return self.sql
+
 class LiteralExpression(Expression):
     """Expression for literal values (numbers, strings, etc.)."""
+
+    __slots__ = ('value',)
+
+    _needs_parens = False
     
     def __init__(self, value: Any):
         self.value = value
     
-    def build(self) -> Tuple[str, List[Any]]:
+    def _build_into(self, out_params: List[Any]) -> str:
         if self.value is None:
-            return 'NULL', []
-        return '%s', [self.value]
+            return 'NULL'
+        out_params.append(self.value)
+        return '%s'
     
+# Set by `freeze()` while it builds, placeholders may only be rendered then
+_FREEZING: ContextVar[bool] = ContextVar('_FREEZING', default=False)
+
+class ParamExpression(Expression):
+    """Named placeholder, bound when a frozen query is called. See `pgantics.freeze()`."""
+
+    __slots__ = ('name',)
+
+    _needs_parens = False
+    # A plain build() must fail, so it can't be served from a freeze() result
+    _cacheable = False
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        if not _FREEZING.get():
+            raise ValueError(f"param({self.name!r}) is unbound, use pgantics.freeze() to bind it")
+
+        # The placeholder itself stands in for the value until it is bound
+        out_params.append(self)
+        return '%s'
+
+    def __repr__(self) -> str:
+        return f"param({self.name!r})"
+
 class NullExpression(Expression):
     """Special expression for NULL values."""
+
+    __slots__ = ()
+
+    _needs_parens = False
     
     def __init__(self):
         pass
     
-    def build(self) -> Tuple[str, List[Any]]:
-        return 'NULL', []
+    def _build_into(self, out_params: List[Any]) -> str:
+        return 'NULL'
+
+# NullExpression carries no state, so a single shared instance serves every NULL
+_NULL = NullExpression()
         
 class Alias(BaseExpression):
     """Aliased expression (expression AS alias)."""
+
+    __slots__ = ('expression', 'alias', '_cacheable', '_built')
     
     def __init__(self, expression: BaseExpression, alias: str):
         self.expression = expression
         self.alias = alias
 
-    def build(self) -> Tuple[str, List[Any]]:
-        expr_sql, params = self.expression.build()
-        return f'{expr_sql} AS {self.alias}', params
+        self._cacheable = expression._cacheable
+        self._built = None
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        expr_sql = self.expression._build_into(out_params)
+        return self._memoize(''.join((expr_sql, _AS, self.alias)), out_params, start)
     
 class BinaryExpression(Expression):
     """Binary operation between two expressions."""
+
+    __slots__ = ('left', 'operator', 'right', '_op_str', '_cacheable', '_built')
     
     def __init__(self, left: BaseExpression, operator: BinaryOperator, right: BaseExpression):
         self.left = left
         self.operator = operator
         self.right = right
 
-    def build(self) -> Tuple[str, List[Any]]:
-        left_sql, left_params = self.left.build()
-        right_sql, right_params = self.right.build()
+        self._op_str = sys.intern(f' {BINARY_OPERATOR_SQL[operator]} ')
+        self._cacheable = left._cacheable and right._cacheable
+        self._built = None
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        left_sql = self.left._build_into(out_params)
+        right_sql = self.right._build_into(out_params)
 
-        sql = f'({left_sql} {self.operator.value} {right_sql})'
-        return sql, left_params + right_params
+        sql = ''.join(('(', left_sql, self._op_str, right_sql, ')'))
+        return self._memoize(sql, out_params, start)
     
 class UnaryExpression(Expression):
     """Unary operation on an expression."""
+
+    __slots__ = ('operator', 'operand', '_cacheable', '_built')
     
     def __init__(self, operator: str, operand: BaseExpression):
         self.operator = operator
         self.operand = operand
+
+        self._cacheable = operand._cacheable
+        self._built = None
     
-    def build(self) -> Tuple[str, List[Any]]:
-        operand_sql, params = self.operand.build()
-        return f'{self.operator}({operand_sql})', params
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        operand_sql = self.operand._build_into(out_params)
+        return self._memoize(''.join((self.operator, '(', operand_sql, ')')), out_params, start)
     
 class FunctionExpression(Expression):
     """SQL function call expression."""
+
+    __slots__ = ('name', 'args', 'distinct', 'filter_condition', 'over_clause', '_cacheable', '_built')
     
     def __init__(self, name: str, *args: BaseExpression, distinct: bool = False, 
                  filter_condition: Optional['Condition'] = None, 
                  over_clause: Optional[str] = None):
         self.name = name.upper()
-        self.args = list(args)
+        self.args = args
         self.distinct = distinct
         self.filter_condition = filter_condition
         self.over_clause = over_clause
+
+        self._cacheable = all(arg._cacheable for arg in self.args) and (
+            filter_condition is None or filter_condition._cacheable
+        )
+        self._built = None
     
-    def build(self) -> Tuple[str, List[Any]]:
-        params = []
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        parts = [self.name, '(']
         
-        # Build arguments
+        # Build arguments, with DISTINCT if specified
         if self.args:
-            arg_sqls = []
-            for arg in self.args:
-                arg_sql, arg_params = arg.build()
-                arg_sqls.append(arg_sql)
-                params.extend(arg_params)
-            args_part = ', '.join(arg_sqls)
-        else:
-            args_part = ''
-        
-        # Add DISTINCT if specified
-        if self.distinct and args_part:
-            args_part = f'DISTINCT {args_part}'
-        
-        # Build base function call
-        sql = f'{self.name}({args_part})'
+            if self.distinct:
+                parts.append('DISTINCT ')
+
+            parts.append(', '.join([arg._build_into(out_params) for arg in self.args]))
+
+        parts.append(')')
         
         # Add FILTER clause if specified
         if self.filter_condition:
-            filter_sql, filter_params = self.filter_condition.build()
-            sql = f'{sql} FILTER (WHERE {filter_sql})'
-            params.extend(filter_params)
+            filter_sql = self.filter_condition._build_into(out_params)
+            parts.extend((_FILTER, filter_sql, ')'))
         
         # Add OVER clause for window functions
         if self.over_clause:
-            sql = f'{sql} OVER ({self.over_clause})'
+            parts.extend((_OVER, self.over_clause, ')'))
         
-        return sql, params
-    
+        return self._memoize(''.join(parts), out_params, start)
+    
+    def _copy(self) -> 'FunctionExpression':
+        """Shallow copy that skips __init__; the name is already normalized."""
+        new = object.__new__(self.__class__)
+        new.name = self.name
+        new.args = self.args
+        new.distinct = self.distinct
+        new.filter_condition = self.filter_condition
+        new.over_clause = self.over_clause
+        new._cacheable = self._cacheable
+        new._built = None
+        return new
+
     def with_distinct(self) -> 'FunctionExpression':
         """Return a copy of this function with DISTINCT modifier."""
-        return FunctionExpression(
-            self.name, *self.args, 
-            distinct=True, 
-            filter_condition=self.filter_condition,
-            over_clause=self.over_clause
-        )
+        new = self._copy()
+        new.distinct = True
+        return new
     
     def filter(self, condition: 'Condition') -> 'FunctionExpression':
         """Add a FILTER clause for aggregate functions."""
-        return FunctionExpression(
-            self.name, *self.args,
-            distinct=self.distinct,
-            filter_condition=condition,
-            over_clause=self.over_clause
-        )
+        new = self._copy()
+        new.filter_condition = condition
+        new._cacheable = all(arg._cacheable for arg in self.args) and condition._cacheable
+        return new
     
     def over(self, clause: str) -> 'FunctionExpression':
         """Add an OVER clause for window functions."""
-        return FunctionExpression(
-            self.name, *self.args,
-            distinct=self.distinct,
-            filter_condition=self.filter_condition,
-            over_clause=clause
-        )
+        new = self._copy()
+        new.over_clause = clause
+        return new
 
 
 class CaseExpression(Expression):
     """SQL CASE expression."""
+
+    __slots__ = ('when_clauses', 'else_clause')
+
+    # when()/else_() mutate the node in place, so its output can't be memoized.
+    _cacheable = False
     
     def __init__(self):
         self.when_clauses: List[Tuple['Condition', BaseExpression]] = []
@@ -322,60 +465,64 @@ class CaseExpression(Expression):
         self.else_clause = to_expression(value)
         return self
     
-    def build(self) -> Tuple[str, List[Any]]:
+    def _build_into(self, out_params: List[Any]) -> str:
         if not self.when_clauses:
             raise ValueError("CASE expression must have at least one WHEN clause")
         
         sql_parts = ['CASE']
-        params = []
         
+        # Conditions and values are built in order so params line up with the placeholders
         for condition, value in self.when_clauses:
-            cond_sql, cond_params = condition.build()
-            val_sql, val_params = value.build()
-            
-            sql_parts.append(f'WHEN {cond_sql} THEN {val_sql}')
-            params.extend(cond_params)
-            params.extend(val_params)
+            sql_parts.extend(('WHEN', condition._build_into(out_params), 'THEN', value._build_into(out_params)))
         
         if self.else_clause:
-            else_sql, else_params = self.else_clause.build()
-            sql_parts.append(f'ELSE {else_sql}')
-            params.extend(else_params)
+            sql_parts.extend(('ELSE', self.else_clause._build_into(out_params)))
         
         sql_parts.append('END')
         
-        return ' '.join(sql_parts), params
+        return ' '.join(sql_parts)
 
 
 class Condition(BaseExpression):
     """SQL condition/predicate expression."""
+
+    __slots__ = ('left', 'operator', 'right', '_op_str', '_postfix', '_needs_parens', '_cacheable', '_built')
     
     def __init__(self, left: BaseExpression, operator: Operator, right: BaseExpression):
         self.left = left
         self.operator = operator
         self.right = right
 
-    def build(self) -> Tuple[str, List[Any]]:
-        left_sql, left_params = self.left.build()
-        right_sql, right_params = self.right.build()
-
-        # Handle special operators
-        if self.operator in [Operator.IS_NULL, Operator.IS_NOT_NULL]:
-            # For IS NULL/IS NOT NULL, we don't need the right side
-            op_str = 'IS NULL' if self.operator == Operator.IS_NULL else 'IS NOT NULL'
-            sql = f'{left_sql} {op_str}'
-            return sql, left_params
+        self._postfix = operator in _POSTFIX_OPERATORS
+        self._needs_parens = not (self._postfix and left._needs_parens is False)
+        op_sql = OPERATOR_SQL[operator]
+        self._op_str = sys.intern(f' {op_sql}' if self._postfix else f' {op_sql} ')
+        self._cacheable = left._cacheable and right._cacheable
+        self._built = None
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        left_sql = self.left._build_into(out_params)
+
+        if self._postfix:
+            return self._memoize(left_sql + self._op_str, out_params, start)
         
-        sql = f'{left_sql} {self.operator.value} {right_sql}'
-        return sql, left_params + right_params
+        right_sql = self.right._build_into(out_params)
+        sql = ''.join((left_sql, self._op_str, right_sql))
+        return self._memoize(sql, out_params, start)
     
     def __and__(self, other: 'Condition') -> 'ConditionTree':
         """Combine conditions with AND."""
-        return ConditionTree('AND', self, other)
+        return ConditionTree(_AND, self, other)
     
     def __or__(self, other: 'Condition') -> 'ConditionTree':
         """Combine conditions with OR."""
-        return ConditionTree('OR', self, other)
+        return ConditionTree(_OR, self, other)
     
     def __invert__(self) -> 'NotCondition':
         """Negate condition with NOT."""
@@ -383,46 +530,80 @@ class Condition(BaseExpression):
     
 class ConditionTree(BaseExpression):
     """Tree of conditions combined with AND/OR."""
+
+    __slots__ = ('operator', 'left', 'right', '_cacheable', '_built')
     
     def __init__(self, operator: str, left: BaseExpression, right: BaseExpression):
         self.operator = operator
         self.left = left
         self.right = right
+
+        self._cacheable = left._cacheable and right._cacheable
+        self._built = None
     
-    def build(self) -> Tuple[str, List[Any]]:
-        left_sql, left_params = self.left.build()
-        right_sql, right_params = self.right.build()
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        left_sql = self.left._build_into(out_params)
+        right_sql = self.right._build_into(out_params)
         
-        sql = f'({left_sql}) {self.operator} ({right_sql})'
-        return sql, left_params + right_params
+        sql = ''.join(('(', left_sql, ') ', self.operator, ' (', right_sql, ')'))
+        return self._memoize(sql, out_params, start)
     
     def __and__(self, other: BaseExpression) -> 'ConditionTree':
-        return ConditionTree('AND', self, other)
+        return ConditionTree(_AND, self, other)
     
     def __or__(self, other: BaseExpression) -> 'ConditionTree':
-        return ConditionTree('OR', self, other)
+        return ConditionTree(_OR, self, other)
 
 
 class NotCondition(BaseExpression):
     """Negated condition."""
+
+    __slots__ = ('condition', '_cacheable', '_built')
     
     def __init__(self, condition: BaseExpression):
         self.condition = condition
+
+        self._cacheable = condition._cacheable
+        self._built = None
     
-    def build(self) -> Tuple[str, List[Any]]:
-        cond_sql, params = self.condition.build()
-        return f'NOT ({cond_sql})', params
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        cond_sql = self.condition._build_into(out_params)
+        return self._memoize(''.join((_NOT, cond_sql, ')')), out_params, start)
     
 class OrderExpression(BaseExpression):
     """ORDER BY expression with direction."""
 
+    __slots__ = ('expression', 'direction', '_direction_str', '_cacheable', '_built')
+
     def __init__(self, expression: BaseExpression, direction: Order):
         self.expression = expression
         self.direction = direction
 
-    def build(self) -> Tuple[str, List[Any]]:
-        expr_sql, params = self.expression.build()
-        return f'{expr_sql} {self.direction}', params
+        self._direction_str = sys.intern(f' {ORDER_SQL[direction]}')
+        self._cacheable = expression._cacheable
+        self._built = None
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        if self._built is not None:
+            out_params.extend(self._built[1])
+            return self._built[0]
+
+        start = len(out_params)
+
+        expr_sql = self.expression._build_into(out_params)
+        return self._memoize(expr_sql + self._direction_str, out_params, start)
     
 class funcs:
     """Function factory for common SQL functions."""
@@ -430,7 +611,7 @@ class funcs:
     @staticmethod
     def Count(expr: Any = None) -> FunctionExpression:
         if expr is None:
-            return FunctionExpression('COUNT', Expression('*'))
+            return FunctionExpression('COUNT', RawExpression('*'))
         return FunctionExpression('COUNT', to_expression(expr))
     
     @staticmethod
@@ -486,7 +667,7 @@ class funcs:
     
     @staticmethod
     def Extract(field: str, expr: Any) -> FunctionExpression:
-        return FunctionExpression('EXTRACT', Expression(f'{field} FROM'), to_expression(expr))
+        return FunctionExpression('EXTRACT', RawExpression(f'{field} FROM'), to_expression(expr))
     
     @staticmethod
     def DateTrunc(precision: str, expr: Any) -> FunctionExpression:
@@ -540,7 +721,7 @@ class funcs:
         return FunctionExpression('LEAD', *args)
 
 def to_expression(value: Any) -> BaseExpression:
-    if isinstance(value, BaseExpression):
+    if getattr(value, '_is_expression', False):
         return value
     else:
         return LiteralExpression(value)
@@ -552,7 +733,11 @@ def literal(value: Any) -> LiteralExpression:
 
 def null() -> NullExpression:
     """Create a NULL expression."""
-    return NullExpression()
+    return _NULL
+
+def param(name: str) -> ParamExpression:
+    """Create a named placeholder, filled in when calling the query's `freeze()` result."""
+    return ParamExpression(name)
 
 def case() -> CaseExpression:
     """Create a CASE expression."""
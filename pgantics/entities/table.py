@@ -1,8 +1,15 @@
-import warnings
+import functools
+import sys
+from types import MappingProxyType, UnionType
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    ForwardRef,
+    FrozenSet,
     List,
+    Mapping,
     Optional,
     Self,
     Tuple,
@@ -12,23 +19,40 @@ from typing import (
     get_type_hints,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic._internal._model_construction import ModelMetaclass
 
-from ..query.delete import Delete
-from ..query.insert import BulkInsert, Insert
-from ..query.select import Select
-from ..query.update import Update
 from ..registry import TABLE_REGISTRY
 from .column import ColumnInfo
 from .expression import BaseExpression
 from .mapped import Mapped
 
+if TYPE_CHECKING:
+    # Query builders are imported on first use, so defining tables doesn't pay for them
+    from ..query.delete import Delete
+    from ..query.insert import BulkInsert, Insert
+    from ..query.select import Select
+    from ..query.update import Update
+
 __all__ = ["Table"]
 
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(obj: Any) -> Dict[str, Any]:
+    """`get_type_hints` is slow, so resolve each class's hints at most once."""
+    return get_type_hints(obj)
+
+@functools.lru_cache(maxsize=None)
+def _required_meta_attrs(meta: type) -> Tuple[str, ...]:
+    """Names of the attributes a subclass Meta must define, i.e. the non-Optional hints."""
+    return tuple(
+        arg for arg, arg_type in _cached_type_hints(meta).items()
+        if not (get_origin(arg_type) in (Union, UnionType) and type(None) in get_args(arg_type))
+    )
+
 class TableMeta(ModelMetaclass):
     def __new__(mcls, name: str, bases: Tuple[type, ...], attrs: Dict[str, Any], **kwargs: Any) -> 'TableMeta':
-        original_annotations = attrs.get('__annotations__', {}).copy()
+        fields: Dict[str, ColumnInfo] = {}
+        inner_types: Dict[str, Any] = {}
 
         for key, annotation in attrs.get('__annotations__', {}).items():
             field = attrs.get(key, None)
@@ -36,46 +60,86 @@ class TableMeta(ModelMetaclass):
             if not field:
                 continue
 
-            origin = get_origin(annotation)
-            args   = get_args(annotation)
-            
-            if origin is Mapped or annotation is Mapped:
-                attrs['__annotations__'][key] = args[0]
-
-        cls = super().__new__(mcls, name, bases, attrs, **kwargs)
+            is_mapped = get_origin(annotation) is Mapped or annotation is Mapped
 
-        fields: Dict[str, ColumnInfo] = {}
-        annotations = get_type_hints(cls)
+            if is_mapped:
+                inner_types[key] = attrs['__annotations__'][key] = get_args(annotation)[0]
 
-        for key, field in attrs.items():
             if not isinstance(field, ColumnInfo):
                 continue
 
-            field.annotation = field.annotation or annotations.get(key, None)
+            if not is_mapped:
+                raise TypeError(
+                    f"Column '{key}' in class '{name}' must be a Mapped annotation. Example: `id: Mapped[int] = Column()`"
+                )
+
+            fields[key] = field
 
+        cls = super().__new__(mcls, name, bases, attrs, **kwargs)
+
+        for key, field in fields.items():
             if field.annotation is None:
-                raise TypeError(f"Field '{key}' in class '{cls.__name__}' has no type annotation.")
+                annotation = inner_types[key]
 
-            origin = get_origin(original_annotations[key])
+                # String/forward references still need resolving against the module
+                if isinstance(annotation, (str, ForwardRef)):
+                    annotation = _cached_type_hints(cls).get(key, None)
 
-            if origin is not Mapped and original_annotations[key] is not Mapped:
-                raise TypeError(
-                    f"Column '{key}' in class '{cls.__name__}' must be a Mapped annotation. Example: `id: Mapped[int] = Column()`"
-                )
+                field.annotation = annotation
 
-            field._source_field = key
-            field._source_table = cls
+            if field.annotation is None:
+                raise TypeError(f"Field '{key}' in class '{cls.__name__}' has no type annotation.")
 
-            fields[key] = field
+            field._bind(cls, key)
 
-        setattr(cls, '__pgantics_fields__', fields)
+        # Bare and table-qualified names both resolve to the column in one dict lookup
+        column_lookup = {**fields, **{str(field): field for field in fields.values()}}
+
+        # Shared by every query built on this table, so hand out a read-only view
+        setattr(cls, '__pgantics_fields__', MappingProxyType(fields))
+        setattr(cls, '__pgantics_field_names__', frozenset(fields))
+        setattr(cls, '__pgantics_column_lookup__', column_lookup)
+
+        # The columns `model_dump()` includes, in its order
+        all_columns = tuple(key for key, info in cls.model_fields.items() if key in fields and not info.exclude)
+        setattr(cls, '__pgantics_all_columns__', all_columns)
+        pk_fields = frozenset(key for key, field in fields.items() if field.sql_data.get('primary_key', False))
+        setattr(cls, '__pgantics_pk_fields__', pk_fields)
+        setattr(cls, '__pgantics_non_pk_columns__', tuple(key for key in all_columns if key not in pk_fields))
         return cls
     
     def __getattr__(cls, name: str) -> Any:
-        if name in cls.__dict__.get('__pgantics_fields__', {}):
-            return cls.__pgantics_fields__[name]
+        fields = cls.__dict__.get('__pgantics_fields__')
+        if fields is not None and name in fields:
+            return fields[name]
         return super().__getattribute__(name)
 
+class _InstanceMethod:
+    """Method meant to be called on a table instance.
+
+    Instance access returns the plain bound method. Access through the class returns a
+    wrapper that raises a TypeError when called, the query needs the row's values.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Callable[..., Any]:
+        if instance is not None:
+            return self.func.__get__(instance, owner)
+
+        func = self.func
+
+        @functools.wraps(func)
+        def class_call(*args: Any, **kwargs: Any) -> Any:
+            raise TypeError(
+                f"{owner.__name__}.{func.__name__}() must be called on an instance, "
+                f"e.g. `{owner.__name__}(...).{func.__name__}()`"
+            )
+
+        return class_call
+
 class Table(BaseModel, metaclass=TableMeta):
     """Represents a database table. Built on Pydantic's BaseModel with type-safe columns.
 
@@ -102,7 +166,18 @@ class Table(BaseModel, metaclass=TableMeta):
     ```
     """
 
-    __pgantics_fields__: Dict[str, ColumnInfo]
+    __pgantics_fields__: Mapping[str, ColumnInfo]
+    __pgantics_table_name__: str
+    __pgantics_field_names__: FrozenSet[str]
+    __pgantics_column_lookup__: Dict[str, ColumnInfo]
+    __pgantics_all_columns__: Tuple[str, ...]
+    __pgantics_pk_fields__: FrozenSet[str]
+    __pgantics_non_pk_columns__: Tuple[str, ...]
+    __pgantics_delete_prefix__: str
+    __pgantics_select_all__: str
+
+    # Build the validation schema on first use rather than at class definition
+    model_config = ConfigDict(defer_build=True, ignored_types=(_InstanceMethod,))
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -115,21 +190,22 @@ class Table(BaseModel, metaclass=TableMeta):
         if not base or not issubclass(base, Table):
             raise TypeError(f"Table '{cls.__name__}' must inherit from the Table class.")
 
-        args = get_type_hints(base.Meta)
-
-        for arg, arg_type in args.items():
-            origin = get_origin(arg_type)
-
-            if origin is not Optional and not hasattr(cls.Meta, arg):
+        for arg in _required_meta_attrs(base.Meta):
+            if not hasattr(cls.Meta, arg):
                 raise TypeError(f"Table '{cls.__name__}' is missing required Meta attribute '{arg}'.")
 
+        # Table names end up in every rendered query and in registry lookups
+        cls.Meta.table_name = cls.__pgantics_table_name__ = sys.intern(cls.Meta.table_name)
+        cls.__pgantics_delete_prefix__ = f"DELETE FROM {cls.__pgantics_table_name__}"
+        cls.__pgantics_select_all__ = f"SELECT * FROM {cls.__pgantics_table_name__}"
+
         TABLE_REGISTRY.register(cls)
 
     class Meta:
         table_name: str
 
     @classmethod
-    def select(cls, *columns: Union[str, BaseExpression]) -> Select:
+    def select(cls, *columns: Union[str, BaseExpression]) -> 'Select':
         """Create a SELECT query for this table.
         
         Example:
@@ -151,11 +227,14 @@ class Table(BaseModel, metaclass=TableMeta):
             await database.fetch_many(sql, params)
         ```
         """
+        from ..query.select import Select
+
         query = Select(cls)
         query.select(*columns)
         return query
 
-    def insert(self, *columns: Union[str, ColumnInfo]) -> Insert:
+    @_InstanceMethod
+    def insert(self, *columns: Union[str, ColumnInfo]) -> 'Insert':
         """Create an INSERT query for this table. This is a instance method.
 
         Example:
@@ -178,12 +257,7 @@ class Table(BaseModel, metaclass=TableMeta):
             await database.execute(sql, params)
         ```
         """
-        if not isinstance(self, Table):
-            warnings.warn(
-                f"{self.__name__}.insert() called as a class method. "
-                f"insert() should be called on an instance instead.",
-                stacklevel=2,
-            )
+        from ..query.insert import Insert
 
         query = Insert(self)
         query.insert(*columns)
@@ -191,7 +265,7 @@ class Table(BaseModel, metaclass=TableMeta):
         return query
     
     @classmethod
-    def delete(cls) -> Delete:
+    def delete(cls) -> 'Delete':
         """Create a DELETE query for this table.
         
         Example:
@@ -210,9 +284,12 @@ class Table(BaseModel, metaclass=TableMeta):
             await database.execute(sql, params)
         ```
         """
+        from ..query.delete import Delete
+
         return Delete(cls)
 
-    def update(self, *columns: Union[str, ColumnInfo]) -> Update:
+    @_InstanceMethod
+    def update(self, *columns: Union[str, ColumnInfo]) -> 'Update':
         """Create an UPDATE query for this table.
 
         Example:
@@ -240,12 +317,7 @@ class Table(BaseModel, metaclass=TableMeta):
         ```
         """
 
-        if not isinstance(self, Table):
-            warnings.warn(
-                f"{self.__name__}.update() called as a class method. "
-                f"update() should be called on an instance instead.",
-                stacklevel=2,
-            )
+        from ..query.update import Update
 
         query = Update(self)
         query.update(*columns)
@@ -253,7 +325,7 @@ class Table(BaseModel, metaclass=TableMeta):
         return query
     
     @classmethod
-    def bulk_insert(cls, rows: List[Self], *columns: Union[str, ColumnInfo]) -> BulkInsert:
+    def bulk_insert(cls, rows: List[Self], *columns: Union[str, ColumnInfo]) -> 'BulkInsert':
         """Create a bulk INSERT query for this table.
 
         Example:
@@ -273,6 +345,8 @@ class Table(BaseModel, metaclass=TableMeta):
             query = User.bulk_insert(users)
         ```
         """
+        from ..query.insert import BulkInsert
+
         query = BulkInsert(rows)
         query.insert(*columns)
         return query
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 from enum import StrEnum
 
 __all__ = [
@@ -80,4 +81,11 @@ class ConflictAction(StrEnum):
     """Enum for defining actions in ON CONFLICT clauses."""
 
     DO_NOTHING = "DO NOTHING"
-    DO_UPDATE = "DO UPDATE"
\ No newline at end of file
+    DO_UPDATE = "DO UPDATE"
+
+# Plain, interned `str` renderings of the members used while building queries,
+# so the hot paths skip the enum attribute machinery entirely.
+OPERATOR_SQL = {member: sys.intern(member.value) for member in Operator}
+BINARY_OPERATOR_SQL = {member: sys.intern(member.value) for member in BinaryOperator}
+JOIN_TYPE_SQL = {member: sys.intern(member.value) for member in JoinType}
+ORDER_SQL = {member: sys.intern(member.value) for member in Order}
\ No newline at end of file
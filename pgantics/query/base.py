@@ -1,8 +1,130 @@
+import functools
+import operator
+import types
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple
+from typing import TYPE_CHECKING, Annotated, Any, Callable, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
 
+from pydantic import ConfigDict, PydanticUserError, TypeAdapter
+
+from ..registry import TABLE_REGISTRY
+
+if TYPE_CHECKING:
+    from ..entities.column import ColumnInfo
+    from ..entities.table import Table
+
+@functools.lru_cache(maxsize=256)
+def resolve_table(name: str) -> Type['Table']:
+    """Look up a registered table by class or table name. Failed lookups are not cached."""
+    return TABLE_REGISTRY.get(name)
+
+@functools.lru_cache(maxsize=4096)
+def split_qualified(table: Type['Table'], col: str) -> Tuple[Type['Table'], str]:
+    """Split a 'col' or 'table.col' string into its table and bare column name.
+    Unqualified names belong to `table`."""
+    table_name, dot, column = col.partition('.')
+    if not dot:
+        return table, col
+    return resolve_table(table_name), column
+
+# Tables and their columns are fixed once defined, so resolved names never go stale.
+# Failed lookups raise and are not cached.
+
+@functools.lru_cache(maxsize=4096)
+def resolve_column(table: Type['Table'], col: str) -> 'ColumnInfo':
+    """Resolve a 'col' or 'table.col' string to its column."""
+    column = table.__pgantics_column_lookup__.get(col)
+    if column is not None:
+        return column
+
+    # Qualified with another table's name, or not a column at all
+    table, col = split_qualified(table, col)
+    if col not in table.__pgantics_fields__:
+        raise ValueError(f"Column '{col}' does not exist in table '{table.__pgantics_table_name__}'")
+    return table.__pgantics_fields__[col]
+
+@functools.lru_cache(maxsize=4096)
+def own_column_name(table: Type['Table'], col: str) -> str:
+    """Field name of a 'col' or 'table.col' string. Any qualifier is dropped, the column must exist on `table`."""
+    column = col.partition('.')[2] or col
+    if column not in table.__pgantics_fields__:
+        raise ValueError(f"Column '{column}' does not exist in table '{table.__pgantics_table_name__}'")
+    return column
+
+# Values of these types come out of `model_dump(mode='json')` unchanged
+_JSON_NATIVE_TYPES = frozenset((int, str, bool, type(None)))
+
+def _is_json_native(annotation: Any) -> bool:
+    if annotation in _JSON_NATIVE_TYPES:
+        return True
+    if get_origin(annotation) in (Union, types.UnionType):
+        return all(_is_json_native(arg) for arg in get_args(annotation))
+    return False
+
+@functools.lru_cache(maxsize=4096)
+def column_getter(table: Type['Table'], column: str) -> Optional[Callable[['Table'], Any]]:
+    """Getter returning the value `model_dump(mode='json')` would produce for one column,
+    or None when only `model_dump` itself can tell (e.g. an excluded field)."""
+    field = table.model_fields[column]
+    # `exclude_if` only exists on newer pydantic versions
+    if field.exclude or getattr(field, 'exclude_if', None) is not None:
+        return None
+
+    get = operator.attrgetter(column)
+    if _is_json_native(field.annotation) and not field.metadata:
+        return get
+
+    # The table's serialization settings (e.g. `ser_json_timedelta`) must apply to every value
+    ser_config = {
+        key: value for key, value in table.model_config.items() if key.startswith('ser_') or key == 'json_encoders'
+    }
+    config = ConfigDict(**ser_config) if ser_config else None
+
+    # Keep the field's metadata, it may carry serializers (e.g. `PlainSerializer`)
+    annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+    try:
+        dump = TypeAdapter(annotation, config=config).dump_python
+    except PydanticUserError:
+        # Models and dataclasses carry their own config and refuse another one
+        return None
+    return lambda row: dump(get(row), mode='json')
+
+@functools.lru_cache(maxsize=1024)
+def row_getters(table: Type['Table'], columns: Tuple[str, ...]) -> Optional[Tuple[Callable[['Table'], Any], ...]]:
+    """One getter per column returning the value `model_dump(mode='json')` would produce.
+
+    Returns None when the model customizes serialization (serializers or excluded fields),
+    in which case callers must fall back to `model_dump`.
+    """
+    decorators = table.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        return None
+
+    getters = []
+    for column in columns:
+        get = column_getter(table, column)
+        if get is None:
+            return None
+        getters.append(get)
+
+    return tuple(getters)
+
+@functools.lru_cache(maxsize=1024)
+def row_reader(table: Type['Table'], columns: Tuple[str, ...]) -> Optional[Callable[['Table'], Sequence[Any]]]:
+    """Function reading `columns` off a row as `model_dump(mode='json')` would, or None
+    when `row_getters` can't be used."""
+    getters = row_getters(table, columns)
+    if getters is None:
+        return None
+
+    # A multi-name attrgetter builds the whole tuple in C, with no Python-level loop
+    if len(columns) > 1 and all(type(get) is operator.attrgetter for get in getters):
+        return operator.attrgetter(*columns)
+
+    return lambda row: [get(row) for get in getters]
 
 class Query(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def build(self) -> Tuple[str, List[Any]]:
         """Build the SQL query string."""
@@ -2,24 +2,41 @@ from typing import TYPE_CHECKING, Any, List, Optional, Self, Tuple, Type, Union
 
 from ..entities.column import ColumnInfo
 from ..entities.expression import BaseExpression
-from ..registry import TABLE_REGISTRY
-from .base import Query
+from .base import Query, resolve_table
 
 if TYPE_CHECKING:
     from ..entities.table import Table
 
 __all__ = ["Delete"]
 
+def _column_from_str(col: str) -> str:
+    return col.partition('.')[2] or col
+
+def _column_from_info(col: ColumnInfo) -> str:
+    return col._source_field
+
+# Maps the exact type of a RETURNING argument to a function giving its column name
+_RETURNING_EXTRACTORS = {
+    str: _column_from_str,
+    ColumnInfo: _column_from_info,
+}
+
 class Delete(Query):
     """SQL DELETE query builder with fluent interface."""
 
+    __slots__ = ('table', '_where_conditions', '_joins', '_using_sql', '_returning', '_cache')
+
     def __init__(self, table: Type['Table']):
         self.table = table
 
         self._where_conditions: List[BaseExpression] = []
         self._joins: List['DeleteJoin[Self]'] = []
+        self._using_sql: Optional[str] = None
         self._returning: Optional[List[str]] = None
 
+        # Last build() result; every mutator resets it
+        self._cache: Optional[Tuple[str, Tuple[Any, ...]]] = None
+
     def build(self) -> Tuple[str, List[Any]]:
         """
         Build the complete SQL DELETE statement.
@@ -30,35 +47,32 @@ class Delete(Query):
             sql, params = User.delete().where(User.email.like('%@spam.com')).build()
         ```
         """
+        if self._cache is not None:
+            return self._cache[0], list(self._cache[1])
 
-        sql_parts = []
+        sql_parts = [self.table.__pgantics_delete_prefix__]
         params = []
+        conditions = self._where_conditions
         
-        # DELETE FROM clause
         if self._joins:
             # DELETE with JOINs using USING clause
-            sql_parts.append(f"DELETE FROM {self.table.Meta.table_name}")
+            sql_parts.append(self._using_sql)
             
-            # Add USING clause with all joined tables
-            using_tables = [join.table.Meta.table_name for join in self._joins]
-            sql_parts.append(f"USING {', '.join(using_tables)}")
-            
-            # Add all JOIN conditions to WHERE clause
-            for join in self._joins:
-                if join.on_condition:
-                    self._where_conditions.append(join.on_condition)
-        else:
-            # Simple DELETE
-            sql_parts.append(f"DELETE FROM {self.table.Meta.table_name}")
+            # JOIN conditions go into the WHERE clause, without touching the query's own list
+            conditions = [*conditions, *(join.on_condition for join in self._joins if join.on_condition)]
         
         # WHERE clause
-        if self._where_conditions:
-            where_sqls = []
-            for condition in self._where_conditions:
-                cond_sql, cond_params = condition.build()
-                where_sqls.append(f"({cond_sql})")
-                params.extend(cond_params)
-            sql_parts.append(f"WHERE {' AND '.join(where_sqls)}")
+        if conditions:
+            where_parts = []
+            separator = "WHERE "
+            for condition in conditions:
+                cond_sql = condition._build_into(params)
+                if condition._needs_parens:
+                    where_parts.extend((separator, "(", cond_sql, ")"))
+                else:
+                    where_parts.extend((separator, cond_sql))
+                separator = " AND "
+            sql_parts.append("".join(where_parts))
         else:
             # Safety check - require WHERE clause to prevent accidental full table deletion
             raise ValueError("DELETE query must include a WHERE clause. Use delete_all() for intentional full table deletion.")
@@ -70,7 +84,12 @@ class Delete(Query):
             else:
                 sql_parts.append(f"RETURNING {', '.join(self._returning)}")
 
-        return " ".join(sql_parts), params
+        sql = " ".join(sql_parts)
+
+        # Builder-style nodes (e.g. CASE) can still change after this build, so they disable the cache
+        if all(condition._cacheable for condition in conditions):
+            self._cache = (sql, tuple(params))
+        return sql, params
     
     def join(self, table: Union[Type['Table'], str]) -> 'DeleteJoin[Self]':
         """Start building a JOIN clause.
@@ -92,10 +111,12 @@ class Delete(Query):
         """
 
         if isinstance(table, str):
-            table = TABLE_REGISTRY.get(table)
+            table = resolve_table(table)
 
         join = DeleteJoin(self, table)
         self._joins.append(join)
+        self._using_sql = f"USING {', '.join(join.table.Meta.table_name for join in self._joins)}"
+        self._cache = None
 
         return join
 
@@ -113,6 +134,7 @@ class Delete(Query):
         ```
         """
         self._where_conditions.append(condition)
+        self._cache = None
         return self
     
     def delete_all(self) -> Self:
@@ -129,6 +151,7 @@ class Delete(Query):
         # Override the WHERE clause requirement by adding a always-true condition
         from ..entities.expression import LiteralExpression
         self._where_conditions.append(LiteralExpression(True))
+        self._cache = None
         return self
     
     def returning(self, *columns: Union[str, ColumnInfo]) -> Self:
@@ -141,28 +164,38 @@ class Delete(Query):
         ```
             User.delete().where(User.age < 18).returning('id', 'email')
             User.delete().where(User.active == False).returning('*')
+            User.delete().join(Post).on(Post.user_id == User.id).where(Post.id.is_null()).returning('users.*')
         ```
         """
+        self._cache = None
+
         if not columns:
             self._returning = ['*']
             return self
 
         self._returning = []
         for col in columns:
-            if isinstance(col, str):
-                if col == '*':
+            extractor = _RETURNING_EXTRACTORS.get(type(col))
+
+            if extractor is None:
+                # Exact-type lookup misses subclasses of str
+                if not isinstance(col, str):
+                    raise TypeError(f"Expected string or ColumnInfo, got {type(col).__name__}")
+                extractor = _column_from_str
+
+            column = extractor(col)
+
+            if column == '*':
+                table_name = col.partition('.')[0]
+                if table_name == '*':
                     self._returning = ['*']
                     return self
-                elif '.' in col:
-                    _, column = col.split('.', 1)
-                else:
-                    column = col
-            elif isinstance(col, ColumnInfo):
-                column = col._source_field
-            else:
-                raise TypeError(f"Expected string or ColumnInfo, got {type(col).__name__}")
 
-            if column not in self.table.__pgantics_fields__:
+                # 'users.*' only returns that table's columns, keep the qualifier
+                self._returning.append(f"{resolve_table(table_name).__pgantics_table_name__}.*")
+                continue
+
+            if column not in self.table.__pgantics_field_names__:
                 raise ValueError(f"Column '{column}' does not exist in table '{self.table.Meta.table_name}'")
 
             self._returning.append(column)
@@ -170,6 +203,8 @@ class Delete(Query):
         return self
     
 class DeleteJoin[Q: Delete]:
+    __slots__ = ('query', 'table', 'on_condition')
+
     def __init__(self, query: Q, table: Type['Table']):
         self.query = query
         self.table = table
@@ -191,4 +226,5 @@ class DeleteJoin[Q: Delete]:
         ```
         """
         self.on_condition = condition
+        self.query._cache = None
         return self.query
\ No newline at end of file
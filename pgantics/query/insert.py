@@ -1,21 +1,32 @@
+import datetime
+import functools
+import struct
+import uuid
+from collections.abc import Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
-    Iterable,
+    Iterator,
     List,
     Optional,
     Self,
+    Sequence,
     Tuple,
+    Type,
     Union,
 )
 
+from pydantic_core import to_json
+
+from .. import types
 from ..entities.column import ColumnInfo
 from ..entities.expression import BaseExpression
-from ..registry import TABLE_REGISTRY
-from .base import Query
-
-from..enums import ConflictAction
+from ..enums import ConflictAction
+from ..types.base import PostgresType
+from ..utils import MISSING, placeholders
+from .base import Query, own_column_name, resolve_column, row_reader
 
 if TYPE_CHECKING:
     from ..entities.table import Table
@@ -23,9 +34,160 @@ if TYPE_CHECKING:
 
 __all__ = ["Insert", "BulkInsert"]
 
+_CONFLICT_ACTION_SQL = {
+    ConflictAction.DO_NOTHING: " DO NOTHING",
+    ConflictAction.DO_UPDATE: " DO UPDATE SET",
+}
+
+@functools.lru_cache(maxsize=512)
+def _insert_skeleton(
+    table_name: str,
+    columns: Tuple[str, ...],
+    conflict_target: Optional[Tuple[str, ...]],
+    conflict_action: Optional[ConflictAction],
+    returning: Optional[Tuple[str, ...]],
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """Render the static pieces of an INSERT: the head, the ON CONFLICT clause (up to
+    `DO UPDATE SET` when updating) and the RETURNING clause."""
+    head = f"INSERT INTO {table_name} ({', '.join(columns)})"
+
+    conflict_sql = None
+    if conflict_target is not None:
+        conflict_sql = f"ON CONFLICT ({', '.join(conflict_target)})"
+
+        if conflict_action is not None:
+            conflict_sql += _CONFLICT_ACTION_SQL[conflict_action]
+
+    returning_sql = None
+    if returning:
+        if '*' in returning:
+            returning_sql = "RETURNING *"
+        else:
+            returning_sql = f"RETURNING {', '.join(returning)}"
+
+    return head, conflict_sql, returning_sql
+
+# Binary COPY format, see https://www.postgresql.org/docs/current/sql-copy.html
+_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_COPY_TRAILER = struct.pack('!h', -1)
+_COPY_NULL = struct.pack('!i', -1)
+
+_POSTGRES_EPOCH = datetime.datetime(2000, 1, 1)
+_POSTGRES_EPOCH_TZ = _POSTGRES_EPOCH.replace(tzinfo=datetime.timezone.utc)
+
+def _as_datetime(value: Union[datetime.datetime, str]) -> datetime.datetime:
+    # Dumped rows hold ISO strings, overrides may hold datetimes
+    return value if isinstance(value, datetime.datetime) else datetime.datetime.fromisoformat(value)
+
+def _pack_since(value: datetime.datetime, epoch: datetime.datetime) -> bytes:
+    delta = value - epoch
+    return struct.pack('!q', (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+def _encode_timestamp(value: Union[datetime.datetime, str]) -> bytes:
+    # Like Postgres parsing the text form, a time zone offset is dropped, not applied
+    return _pack_since(_as_datetime(value).replace(tzinfo=None), _POSTGRES_EPOCH)
+
+def _encode_timestamptz(value: Union[datetime.datetime, str]) -> bytes:
+    # Aware values are stored as UTC, naive ones as-is
+    value = _as_datetime(value)
+    return _pack_since(value, _POSTGRES_EPOCH_TZ if value.tzinfo is not None else _POSTGRES_EPOCH)
+
+def _encode_uuid(value: Union[uuid.UUID, str]) -> bytes:
+    return (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+
+_COPY_ENCODERS: Dict[Type[PostgresType], Callable[[Any], bytes]] = {
+    types.Boolean: lambda value: b'\x01' if value else b'\x00',
+    types.SmallInt: struct.Struct('!h').pack,
+    types.SmallSerial: struct.Struct('!h').pack,
+    types.Integer: struct.Struct('!i').pack,
+    types.Serial: struct.Struct('!i').pack,
+    types.BigInt: struct.Struct('!q').pack,
+    types.BigSerial: struct.Struct('!q').pack,
+    types.Real: struct.Struct('!f').pack,
+    types.Char: str.encode,
+    types.BPChar: str.encode,
+    types.VarChar: str.encode,
+    types.Text: str.encode,
+    types.Timestamp: _encode_timestamp,
+    types.TimestampTZ: _encode_timestamptz,
+    types.JSON: to_json,
+    types.JSONB: lambda value: b'\x01' + to_json(value),  # JSONB binary format version 1
+    types.UUID: _encode_uuid,
+}
+
+def _copy_payload(
+    rows: List['Table'],
+    columns: Tuple[str, ...],
+    encoders: List[Callable[[Any], bytes]],
+    overrides: Dict[str, Any],
+    read: Callable[['Table'], Sequence[Any]],
+) -> Iterator[bytes]:
+    """Yield the binary COPY stream for `rows`, one chunk per row.
+
+    `read` gives a row's values for the columns without an override, the same values
+    `build()` would bind.
+    """
+    pack_int = struct.Struct('!i').pack
+    pack_count = struct.Struct('!h').pack(len(columns))
+
+    def encode_cell(col: str, encode: Callable[[Any], bytes], val: Any) -> bytes:
+        if val is None:
+            return _COPY_NULL
+        try:
+            encoded = encode(val)
+        except (struct.error, TypeError, ValueError) as e:
+            raise TypeError(f"Column '{col}' value {val!r} can't be COPY-encoded: {e}") from None
+        return pack_int(len(encoded)) + encoded
+
+    # Overrides are the same for every row, so encode them once up front
+    cells: List[Optional[bytes]] = []
+    dumped = []
+    for col, encode in zip(columns, encoders):
+        if col in overrides:
+            cells.append(encode_cell(col, encode, overrides[col]))
+        else:
+            cells.append(None)
+            dumped.append((col, encode))
+
+    yield _COPY_HEADER
+    for row in rows:
+        values = iter(zip(dumped, read(row)))
+        parts = [pack_count]
+        for cell in cells:
+            if cell is None:
+                (col, encode), val = next(values)
+                cell = encode_cell(col, encode, val)
+            parts.append(cell)
+        yield b''.join(parts)
+    yield _COPY_TRAILER
+
+def _dump_reader(table: Type['Table'], columns: Tuple[str, ...]) -> Callable[['Table'], Sequence[Any]]:
+    """Function reading `columns` off a row as `model_dump(mode='json')` would."""
+    read = row_reader(table, columns)
+    if read is not None:
+        return read
+
+    include = set(columns)
+
+    def read(row: 'Table') -> List[Any]:
+        dump = row.model_dump(mode='json', include=include)
+        return [dump.get(col) for col in columns]
+
+    return read
+
+@functools.lru_cache(maxsize=256)
+def _values_row(count: int) -> str:
+    """Placeholder group for one VALUES row, e.g. `(%s, %s)`."""
+    return f"({placeholders(count)})"
+
 class Insert(Query):
     """SQL INSERT query builder focused on Pydantic model instances."""
-    
+
+    __slots__ = (
+        'table', '_columns', '_overrides', '_returning', '_on_conflict_target', '_on_conflict_action',
+        '_on_conflict_update', '_select_query',
+    )
+
     def __init__(self, table: 'Table'):
         """Initialize with a Pydantic model instance."""
         self.table = table
@@ -41,91 +203,137 @@ class Insert(Query):
 
     def build(self) -> Tuple[str, List[Any]]:
         """Build the complete SQL INSERT statement."""
-        params = []
-        
-        if self._columns:
-            # Only include specified columns
-            model_data = self.table.model_dump(mode='json', include=set(self._columns))
-        else:
-            # Include all columns from the model
-            model_data = self.table.model_dump(mode='json')
+        if self._select_query is not None and self._overrides:
+            raise ValueError("override() can't be combined with from_select(), the SELECT provides every value")
 
-        model_data.update(self._overrides)
-        columns = [col for col in model_data.keys() if col in self.table.__pgantics_fields__]
+        params = []
+        columns = self._insert_columns()
 
-        if not columns:
-            raise ValueError("No valid database columns found to insert")
+        head, conflict_sql, returning_sql = _insert_skeleton(
+            self.table.__pgantics_table_name__,
+            columns,
+            tuple(self._on_conflict_target) if self._on_conflict_target is not None else None,
+            self._on_conflict_action,
+            tuple(self._returning) if self._returning else None,
+        )
 
         # Build the main INSERT statement
-        sql_parts = [
-            f"INSERT INTO {self.table.Meta.table_name}",
-            f"({', '.join(columns)})"
-        ]
+        sql_parts = [head]
 
-        if self._select_query:
+        if self._select_query is not None:
             select_sql, select_params = self._select_query.build()
             sql_parts.append(select_sql)  # No VALUES keyword needed
             params.extend(select_params)
         else:
-            values = self._build_values(self.table, columns)
-        
-            # Handle single vs multiple rows
-            if len(values) == 1:
-                placeholders = ', '.join(['%s'] * len(columns))
-                sql_parts.append(f"VALUES ({placeholders})")
-                params.extend(values[0])
-            else:
-                value_groups = []
-                for row_values in values:
-                    placeholders = ', '.join(['%s'] * len(row_values))
-                    value_groups.append(f"({placeholders})")
-                    params.extend(row_values)
-                sql_parts.append(f"VALUES {', '.join(value_groups)}")
+            sql_parts.append(self._build_values(columns, params))
 
         # ON CONFLICT clause
-        if self._on_conflict_target is not None:
-            conflict_target = f"({', '.join(self._on_conflict_target)})"
-            
-            sql_parts.append(f"ON CONFLICT {conflict_target}")
+        if conflict_sql is not None:
+            sql_parts.append(conflict_sql)
             
-            if self._on_conflict_action == "DO NOTHING":
-                sql_parts.append("DO NOTHING")
-            elif self._on_conflict_action == "DO UPDATE":
-                if not self._on_conflict_update:
-                    raise ValueError("ON CONFLICT DO UPDATE requires SET clause")
-                
-                set_clauses = []
-                for col, val in self._on_conflict_update.items():
-                    if isinstance(val, BaseExpression):
-                        val_sql, val_params = val.build()
-                        set_clauses.append(f"{col} = {val_sql}")
-                        params.extend(val_params)
-                    else:
-                        set_clauses.append(f"{col} = %s")
-                        params.append(val)
-                
-                sql_parts.append(f"DO UPDATE SET {', '.join(set_clauses)}")
+            if self._on_conflict_action is ConflictAction.DO_UPDATE:
+                sql_parts.append(self._build_conflict_update(params))
 
         # RETURNING clause
-        if self._returning:
-            if '*' in self._returning:
-                sql_parts.append("RETURNING *")
-            else:
-                sql_parts.append(f"RETURNING {', '.join(self._returning)}")
+        if returning_sql is not None:
+            sql_parts.append(returning_sql)
 
         return " ".join(sql_parts), params
 
-    def _build_values(self, table: 'Table', columns: List[str]) -> List[List[Any]]:
-        if self._columns:
-            dump = table.model_dump(mode='json', include=set(self._columns))
+    def _insert_columns(self) -> Tuple[str, ...]:
+        """Same columns, in the same order, that `model_dump()` plus the overrides would give.
+        A SELECT source keeps the caller's order, it must line up with the SELECT list."""
+        columns = self.table.__pgantics_all_columns__
+        if self._select_query is not None and self._columns is not None:
+            columns = tuple(self._columns)
+        elif self._columns is not None:
+            include = self._columns
+            columns = tuple(col for col in columns if col in include)
+
+        if self._select_query is None and row_reader(type(self.table), columns) is None:
+            # The model's serialization decides which keys it dumps (e.g. `exclude_if`)
+            fields = self.table.__pgantics_fields__
+            dump = self.table.model_dump(mode='json', include=set(columns))
+            columns = tuple(col for col in dump if col in fields)
+
+        if self._overrides:
+            columns += tuple(col for col in self._overrides if col not in columns)
+
+        if not columns:
+            raise ValueError("No valid database columns found to insert")
+        return columns
+
+    def _build_conflict_update(self, params: List[Any]) -> str:
+        """Render the SET assignments of ON CONFLICT DO UPDATE, adding their params."""
+        if not self._on_conflict_update:
+            raise ValueError("ON CONFLICT DO UPDATE requires SET clause")
+
+        set_clauses = []
+        for col, val in self._on_conflict_update.items():
+            if isinstance(val, BaseExpression):
+                set_clauses.append(f"{col} = {val._build_into(params)}")
+            else:
+                set_clauses.append(f"{col} = %s")
+                params.append(val)
+
+        return ', '.join(set_clauses)
+
+    def _build_values(self, columns: Tuple[str, ...], params: List[Any]) -> str:
+        """Render the VALUES clause, adding the row's values to `params`."""
+        table = self.table
+        read = None if self._overrides else row_reader(type(table), columns)
+
+        # A single row without overrides is read straight off the cached reader
+        if read is None:
+            row_sql, read = self._row_reader(type(table), columns)
         else:
-            dump = table.model_dump(mode='json')
-            dump = {col: dump[col] for col in columns if col in dump}
+            row_sql = _values_row(len(columns))
+        params.extend(read(table))
+
+        return "VALUES " + row_sql
+
+    def _row_reader(
+        self, table: Type['Table'], columns: Tuple[str, ...],
+    ) -> Tuple[str, Callable[['Table'], Sequence[Any]]]:
+        """Return the SQL of one VALUES row and a function reading a row's values for it.
+
+        Expression overrides are rendered inline, the other columns get a placeholder.
+        """
+        overrides = self._overrides
+        dumped = tuple(col for col in columns if col not in overrides)
+
+        # Params of each override, in the position of its column
+        override_params: Dict[str, List[Any]] = {}
+        row_parts = []
+        for col in columns:
+            val = overrides.get(col)
+            if isinstance(val, BaseExpression):
+                override_params[col] = []
+                row_parts.append(val._build_into(override_params[col]))
+            else:
+                if col in overrides:
+                    override_params[col] = [val]
+                row_parts.append('%s')
+
+        row_sql = f"({', '.join(row_parts)})" if override_params else _values_row(len(columns))
 
-        dump.update(self._overrides)
+        dump_values = _dump_reader(table, dumped)
+
+        if not overrides:
+            return row_sql, dump_values
+
+        def read(row: 'Table') -> List[Any]:
+            # Ensure we have values for all columns in the right order
+            values = iter(dump_values(row))
+            row_values = []
+            for col in columns:
+                if col in override_params:
+                    row_values.extend(override_params[col])
+                else:
+                    row_values.append(next(values))
+            return row_values
 
-        # Ensure we have values for all columns in the right order
-        return [[dump.get(col) for col in columns]]
+        return row_sql, read
 
     def insert(self, *columns: Union[str, ColumnInfo]) -> Self:
         """Specify columns to insert.
@@ -145,73 +353,59 @@ class Insert(Query):
 
         self._columns = []
 
+        table = type(self.table)
         for col in columns:
             if isinstance(col, str):
-                # Handle string column names
-                if '.' in col:
-                    table_name, column = col.split('.', 1)
-                    table = TABLE_REGISTRY.get(table_name)
-                else:
-                    table = self.table
-                    column = col
-
-                if column not in table.__pgantics_fields__:
-                    raise ValueError(f"Column '{column}' does not exist in table '{table.Meta.table_name}'")
-                col = table.__pgantics_fields__[column]
+                col = resolve_column(table, col)
 
-            self._columns.append(str(col))
+            # model_dump() keys are bare field names, so don't store the qualified name
+            self._columns.append(col._source_field)
 
         return self
 
-    def override(self, updates: Dict[Union[str, ColumnInfo], Any]) -> Self:
+    def override(self, updates: Optional[Dict[Union[str, ColumnInfo], Any]] = None, /, **columns: Any) -> Self:
         """Override specific columns with new values.
 
         Args:
-            updates: Dictionary of column names or ColumnInfo objects to their new values
+            updates: Dictionary of column names or ColumnInfo objects to their new values. Expression values are rendered into the SQL
+            **columns: Column names of this table to their new values
 
         Example:
         ```
             user.insert().override({'email': 'new@example.com', 'updated_at': funcs.Now()}) # inserts all columns, but overrides email and updated at
             user.insert(User.id, "email").override({User.last_login: funcs.Now()})
+            user.insert().override(updated_at=funcs.Now())
         ```
         """
+        if updates is None:
+            updates = columns
+        elif columns:
+            updates = {**updates, **columns}
 
+        table = type(self.table)
         for key, val in updates.items():
-            if isinstance(key, ColumnInfo):
-                column_name = key._source_field
-            elif isinstance(key, str):
-                if '.' in key:
-                    _, column_name = key.split('.', 1)
-                else:
-                    column_name = key
+            if isinstance(key, str):
+                column_name = own_column_name(table, key)
+            elif isinstance(key, ColumnInfo):
+                column_name = own_column_name(table, key._source_field)
             else:
                 raise TypeError(f"Expected string or ColumnInfo key, got {type(key).__name__}")
 
-            if column_name not in self.table.__pgantics_fields__:
-                raise ValueError(f"Column '{column_name}' does not exist in table '{self.table.Meta.table_name}'")
-
             self._overrides[column_name] = val
 
         return self
 
     def on_conflict(self, targets: Union[str, ColumnInfo, Iterable[Union[str, ColumnInfo]]]) -> 'OnConflict[Self]':
         """Add ON CONFLICT clause."""
-        if not isinstance(targets, Iterable):
-            targets = [targets]
+        # A str is iterable too, so check for the single-target forms explicitly
+        if isinstance(targets, (str, ColumnInfo)):
+            targets = (targets,)
 
         correct_targets: List[str] = []
+        table = type(self.table)
         for target_item in targets:
             if isinstance(target_item, str):
-                if '.' in target_item:
-                    table_name, column = target_item.split('.', 1)
-                    table = TABLE_REGISTRY.get(table_name)
-                else:
-                    table = self.table
-                    column = target_item
-
-                if column not in table.__pgantics_fields__:
-                    raise ValueError(f"Column '{column}' does not exist in table '{table.Meta.table_name}'")
-                target_item = table.__pgantics_fields__[column]
+                target_item = resolve_column(table, target_item)
 
             correct_targets.append(target_item._source_field)
 
@@ -219,28 +413,22 @@ class Insert(Query):
 
     def returning(self, *columns: Union[str, ColumnInfo]) -> Self:
         """Set columns to return after insert."""
-        if not columns:
+        # '*' returns everything, so the other columns needn't be validated.
+        # Only compare strings, `ColumnInfo == '*'` builds a (truthy) condition.
+        if not columns or any(isinstance(col, str) and col == '*' for col in columns):
             self._returning = ['*']
             return self
 
         self._returning = []
+        table = type(self.table)
         for col in columns:
             if isinstance(col, str):
-                if col == '*':
-                    self._returning = ['*']
-                    return self
-                elif '.' in col:
-                    _, column = col.split('.', 1)
-                else:
-                    column = col
+                column = own_column_name(table, col)
             elif isinstance(col, ColumnInfo):
-                column = col._source_field
+                column = own_column_name(table, col._source_field)
             else:
                 raise TypeError(f"Expected string or ColumnInfo, got {type(col).__name__}")
 
-            if column not in self.table.__pgantics_fields__:
-                raise ValueError(f"Column '{column}' does not exist in table '{self.table.Meta.table_name}'")
-
             self._returning.append(column)
 
         return self
@@ -276,30 +464,116 @@ class Insert(Query):
 
 class BulkInsert[B: 'Table'](Insert):
     """Alias for Insert to indicate bulk insert usage."""
+
+    __slots__ = ('_tables',)
+
     def __init__(self, tables: Iterable[B]):
+        tables = list(tables)
         if not tables:
             raise ValueError("At least one instance is required for bulk insert")
 
+        # The first row stands in for the table when resolving columns
+        super().__init__(tables[0])
         self._tables = tables
-        self._columns: Optional[List[str]] = None  # None means all columns
-
-        self._returning: Optional[List[str]] = None
-        self._on_conflict_target: Optional[Union[str, List[str]]] = None
-        self._on_conflict_action: Optional[ConflictAction] = None
-        self._on_conflict_update: Optional[Dict[str, Any]] = None
 
-    def _build_values(self, columns: List[str]) -> List[List[Any]]:
-        values: List[List[Any]] = []
+    def _build_values(self, columns: Tuple[str, ...], params: List[Any]) -> str:
+        row_sql, read = self._row_reader(type(self.table), columns)
         for table in self._tables:
-            table_values = super()._build_values(table, columns)
-            values.extend(table_values)
+            params.extend(read(table))
 
-        return values
+        return "VALUES " + ', '.join([row_sql] * len(self._tables))
 
     def from_select(self, query: 'Select') -> Self:
         raise NotImplementedError("BulkInsert does not support from_select method")
 
+    def build_many(self) -> Tuple[str, List[Tuple[Any, ...]]]:
+        """Build a single-row INSERT and one params tuple per row, for `executemany()`.
+
+        The driver can then prepare the statement once and bind each row, instead of
+        parsing one huge multi-row VALUES statement. ON CONFLICT applies per row, but
+        RETURNING is not supported.
+
+        Example:
+        ```
+            sql, rows = User.bulk_insert(users).on_conflict('email').do_nothing().build_many()
+            cursor.executemany(sql, rows)
+        ```
+        """
+        if self._returning:
+            raise ValueError("executemany() does not return rows, use build() for RETURNING")
+
+        columns = self._insert_columns()
+        head, conflict_sql, _ = _insert_skeleton(
+            self.table.__pgantics_table_name__,
+            columns,
+            tuple(self._on_conflict_target) if self._on_conflict_target is not None else None,
+            self._on_conflict_action,
+            None,
+        )
+
+        row_sql, read = self._row_reader(type(self.table), columns)
+        sql_parts = [head, "VALUES " + row_sql]
+
+        # The DO UPDATE SET params are the same for every row
+        conflict_params = []
+        if conflict_sql is not None:
+            sql_parts.append(conflict_sql)
+
+            if self._on_conflict_action is ConflictAction.DO_UPDATE:
+                sql_parts.append(self._build_conflict_update(conflict_params))
+
+        return " ".join(sql_parts), [(*read(table), *conflict_params) for table in self._tables]
+
+    def build_copy(self) -> Tuple[str, Iterator[bytes]]:
+        """Build a `COPY ... FROM STDIN` statement and its binary-format payload.
+
+        COPY skips the per-row parsing and planning of a multi-row INSERT, which makes it
+        far faster for large batches. It can't express ON CONFLICT or RETURNING, and
+        overrides must be plain values.
+
+        Example:
+        ```
+            sql, payload = User.bulk_insert(users).build_copy()
+
+            # psycopg 3
+            with cursor.copy(sql) as copy:
+                for chunk in payload:
+                    copy.write(chunk)
+        ```
+        """
+        if self._on_conflict_target is not None or self._returning:
+            raise ValueError("COPY does not support ON CONFLICT or RETURNING, use build() instead")
+
+        columns = self._insert_columns()
+        table = type(self.table)
+        fields = table.__pgantics_fields__
+
+        encoders = []
+        for col in columns:
+            pg_type = fields[col]._type
+            if pg_type is MISSING:
+                raise TypeError(f"Column '{col}' has no PostgreSQL type, COPY can't encode it")
+
+            pg_class = pg_type if isinstance(pg_type, type) else type(pg_type)
+            encoder = _COPY_ENCODERS.get(pg_class)
+            if encoder is None:
+                raise TypeError(f"Column '{col}' has no binary COPY encoding for type {pg_class.__name__}")
+            encoders.append(encoder)
+
+        overrides = {}
+        for col, val in self._overrides.items():
+            if isinstance(val, BaseExpression):
+                raise ValueError(f"COPY cannot insert the expression override for column '{col}'")
+            overrides[col] = val
+
+        read = _dump_reader(table, tuple(col for col in columns if col not in overrides))
+
+        sql = f"COPY {table.Meta.table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT BINARY)"
+        return sql, _copy_payload(self._tables, columns, encoders, overrides, read)
+
 class OnConflict[Q: Insert]:
+    __slots__ = ('query', 'target')
+
     def __init__(self, query: Q, target: List[str]):
         self.query = query
         self.target = target
@@ -318,9 +592,16 @@ class OnConflict[Q: Insert]:
         if not self.query._on_conflict_update:
             self.query._on_conflict_update = {}
 
+        # SET targets can't be qualified, so store the bare column names
+        table = type(self.query.table)
         for key, val in updates.items():
-            if isinstance(key, ColumnInfo):
-                key = str(key)
-            self.query._on_conflict_update[key] = val
+            if isinstance(key, str):
+                column_name = own_column_name(table, key)
+            elif isinstance(key, ColumnInfo):
+                column_name = own_column_name(table, key._source_field)
+            else:
+                raise TypeError(f"Expected string or ColumnInfo key, got {type(key).__name__}")
+
+            self.query._on_conflict_update[column_name] = val
 
         return self.query
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     List,
     Literal,
     Optional,
@@ -12,30 +14,96 @@ from typing import (
 )
 
 from ..entities.column import ColumnInfo
-from ..entities.expression import BaseExpression, Expression, OrderExpression
-from ..enums import JoinType
+from ..entities.expression import BaseExpression, ConditionTree, Expression, OrderExpression, RawExpression
+from ..enums import JOIN_TYPE_SQL, JoinType
 from ..registry import TABLE_REGISTRY
-from .base import Query
+from .base import Query, split_qualified
 
 if TYPE_CHECKING:
     from ..entities.table import Table
 
 __all__ = ["Select"]
 
+# NATURAL and CROSS joins take no ON condition
+_JOINS_WITHOUT_ON = frozenset((JoinType.NATURAL, JoinType.CROSS))
+
+def _extend_and_terms(conditions: List[BaseExpression], condition: BaseExpression) -> None:
+    """Add `condition` to a list of ANDed conditions, splitting nested ANDs into their terms."""
+    if type(condition) is ConditionTree and condition.operator == 'AND':
+        _extend_and_terms(conditions, condition.left)
+        _extend_and_terms(conditions, condition.right)
+    else:
+        conditions.append(condition)
+
+def _write_conditions(parts: List[str], keyword: str, conditions: List[BaseExpression], params: List[Any]) -> None:
+    """Write `keyword` and the AND of `conditions` into `parts`, parenthesizing only where needed."""
+    if len(conditions) == 1:
+        # A lone condition never needs grouping
+        parts.append(keyword)
+        parts.append(conditions[0]._build_into(params))
+        return
+
+    separator = keyword
+    for condition in conditions:
+        parts.append(separator)
+        cond_sql = condition._build_into(params)
+        if condition._needs_parens:
+            parts.extend(("(", cond_sql, ")"))
+        else:
+            parts.append(cond_sql)
+        separator = " AND "
+
+def _order_as_is(query: 'Select', expr: OrderExpression) -> OrderExpression:
+    return expr
+
+def _order_from_str(query: 'Select', expr: str) -> OrderExpression:
+    return query._string_expression(expr).asc()
+
+def _order_ascending(query: 'Select', expr: Expression) -> OrderExpression:
+    # Default to ascending order
+    return expr.asc()
+
+# Maps the type of an ORDER BY argument to a function turning it into an OrderExpression.
+# Subclasses are resolved through their MRO on first sight and cached here.
+_ORDER_BY_HANDLERS: Dict[type, Callable[['Select', Any], OrderExpression]] = {
+    OrderExpression: _order_as_is,
+    str: _order_from_str,
+    Expression: _order_ascending,
+}
+
+def _order_by_handler(expr_type: type) -> Callable[['Select', Any], OrderExpression]:
+    handler = next((_ORDER_BY_HANDLERS[base] for base in expr_type.__mro__ if base in _ORDER_BY_HANDLERS), None)
+    if handler is None:
+        raise TypeError(f"Invalid order expression type: {expr_type}")
+
+    _ORDER_BY_HANDLERS[expr_type] = handler
+    return handler
+
 class Select(Query):
     """SQL SELECT query builder with fluent interface."""
+
+    __slots__ = (
+        'table', '_select_columns', '_joins', '_where_conditions', '_order_by_expressions',
+        '_limit_value', '_offset_value', '_distinct', '_group_by_expressions', '_having_conditions',
+        '_cache',
+    )
     
     def __init__(self, table: Type['Table']):
         self.table = table
-        self._select_columns: List[BaseExpression] = []
-        self._joins: List['SelectJoin[Self]'] = []
-        self._where_conditions: List[BaseExpression] = []
-        self._order_by_expressions: List[OrderExpression] = []
+
+        # Clause lists are created by the first mutator that needs them
+        self._select_columns: Optional[List[BaseExpression]] = None
+        self._joins: Optional[List['SelectJoin[Self]']] = None
+        self._where_conditions: Optional[List[BaseExpression]] = None
+        self._order_by_expressions: Optional[List[OrderExpression]] = None
         self._limit_value: Optional[int] = None
         self._offset_value: Optional[int] = None
         self._distinct: bool = False
-        self._group_by_expressions: List[BaseExpression] = []
-        self._having_conditions: List[BaseExpression] = []
+        self._group_by_expressions: Optional[List[BaseExpression]] = None
+        self._having_conditions: Optional[List[BaseExpression]] = None
+
+        # Last build() result; every mutator resets it
+        self._cache: Optional[Tuple[str, Tuple[Any, ...]]] = None
 
     def build(self) -> Tuple[str, List[Any]]:
         """
@@ -48,90 +116,94 @@ class Select(Query):
             sql, params = User.select().order_by(User.name).limit(10).build()
         ```
         """
-        sql_parts = []
+        if self._cache is not None:
+            return self._cache[0], list(self._cache[1])
+
+        # Plain `Table.select()`, the statement is precomputed on the table
+        if not (
+            self._select_columns or self._joins or self._where_conditions or self._group_by_expressions
+            or self._having_conditions or self._order_by_expressions or self._distinct
+            or self._limit_value is not None or self._offset_value is not None
+        ):
+            return self.table.__pgantics_select_all__, []
+
+        # Every fragment, separators included, goes into one list joined once at the end
         params = []
-        
-        # SELECT clause
-        select_part = "SELECT"
-        if self._distinct:
-            select_part += " DISTINCT"
-        
+        parts = ["SELECT DISTINCT " if self._distinct else "SELECT "]
+        append = parts.append
+
         if self._select_columns:
-            column_sqls = []
             for col in self._select_columns:
-                if isinstance(col, ColumnInfo):
-                    column_sqls.append(str(col))
-                elif isinstance(col, BaseExpression):
-                    col_sql, col_params = col.build()
-
-                    column_sqls.append(col_sql)
-                    params.extend(col_params)
-                else:
+                if not isinstance(col, BaseExpression):
                     raise TypeError(f"Invalid column type: {type(col)}")
-            
-            select_part += f" {', '.join(column_sqls)}"
+                append(col._build_into(params))
+                append(", ")
+            parts[-1] = " FROM "
         else:
             # Default to all columns from main table
-            select_part += " *"
-        
-        sql_parts.append(select_part)
-        
-        # FROM clause
-        sql_parts.append(f"FROM {self.table.Meta.table_name}")
-        
+            append("* FROM ")
+
+        append(self.table.__pgantics_table_name__)
+
         # JOIN clauses
-        for join in self._joins:
-            join_sql, join_params = join._build()
-            sql_parts.append(join_sql)
-            params.extend(join_params)
-        
+        if self._joins:
+            for join in self._joins:
+                append(" ")
+                append(join._build_into(params))
+
         # WHERE clause
         if self._where_conditions:
-            where_sqls = []
-            for condition in self._where_conditions:
-                cond_sql, cond_params = condition.build()
-                where_sqls.append(f"({cond_sql})")
-                params.extend(cond_params)
-            sql_parts.append(f"WHERE {' AND '.join(where_sqls)}")
-        
+            _write_conditions(parts, " WHERE ", self._where_conditions, params)
+
         # GROUP BY clause
         if self._group_by_expressions:
-            group_sqls = []
+            append(" GROUP BY ")
             for expr in self._group_by_expressions:
-                expr_sql, expr_params = expr.build()
-                group_sqls.append(expr_sql)
-                params.extend(expr_params)
-            sql_parts.append(f"GROUP BY {', '.join(group_sqls)}")
-        
+                append(expr._build_into(params))
+                append(", ")
+            parts.pop()
+
         # HAVING clause
         if self._having_conditions:
-            having_sqls = []
-            for condition in self._having_conditions:
-                cond_sql, cond_params = condition.build()
-                having_sqls.append(f"({cond_sql})")
-                params.extend(cond_params)
-            sql_parts.append(f"HAVING {' AND '.join(having_sqls)}")
-        
+            _write_conditions(parts, " HAVING ", self._having_conditions, params)
+
         # ORDER BY clause
         if self._order_by_expressions:
-            order_sqls = []
+            append(" ORDER BY ")
             for order_expr in self._order_by_expressions:
-                order_sql, order_params = order_expr.build()
-                order_sqls.append(order_sql)
-                params.extend(order_params)
-            sql_parts.append(f"ORDER BY {', '.join(order_sqls)}")
-        
+                append(order_expr._build_into(params))
+                append(", ")
+            parts.pop()
+
         # LIMIT clause
         if self._limit_value is not None:
-            sql_parts.append("LIMIT %s")
+            append(" LIMIT %s")
             params.append(self._limit_value)
-        
+
         # OFFSET clause
         if self._offset_value is not None:
-            sql_parts.append("OFFSET %s")
+            append(" OFFSET %s")
             params.append(self._offset_value)
-        
-        return " ".join(sql_parts), params
+
+        sql = "".join(parts)
+
+        # Builder-style nodes (e.g. CASE) can still change after this build, so they disable the cache
+        if self._is_cacheable():
+            self._cache = (sql, tuple(params))
+        return sql, params
+
+    def _is_cacheable(self) -> bool:
+        """Whether every expression in the query reports a fixed rendering."""
+        for expressions in (
+            self._select_columns, self._where_conditions, self._group_by_expressions,
+            self._having_conditions, self._order_by_expressions,
+        ):
+            if expressions and not all(expr._cacheable for expr in expressions):
+                return False
+
+        return not self._joins or all(
+            join.on_condition is None or join.on_condition._cacheable for join in self._joins
+        )
 
     def select(self, *columns: Union[str, BaseExpression]) -> Self:
         """Specify columns to select.
@@ -144,19 +216,27 @@ class Select(Query):
             User.select('id', 'name', User.email, func.Count())
         ```
         """
+        self._cache = None
+
+        if not columns:
+            return self
+
+        if self._select_columns is None:
+            self._select_columns = []
+
+        lookup = self.table.__pgantics_column_lookup__
         for col in columns:
-            if isinstance(col, str):
-                # Handle string column names
-                if '.' in col:
-                    table_name, column = col.split('.', 1)
-                    table = TABLE_REGISTRY.get(table_name)
-                else:
-                    table = self.table
-                    column = col
-
-                if column not in table.__pgantics_fields__:
-                    raise ValueError(f"Column '{column}' does not exist in table '{table.Meta.table_name}'")
-                col = table.__pgantics_fields__[column]
+            # Exact type checks first, isinstance only for str subclasses
+            col_type = type(col)
+            if col_type is str or (col_type is not ColumnInfo and isinstance(col, str)):
+                # Handle string column names, columns of this table are a single lookup
+                column = lookup.get(col)
+                if column is None:
+                    table, name = split_qualified(self.table, col)
+                    if name not in table.__pgantics_fields__:
+                        raise ValueError(f"Column '{name}' does not exist in table '{table.__pgantics_table_name__}'")
+                    column = table.__pgantics_fields__[name]
+                col = column
 
             self._select_columns.append(col)
 
@@ -164,6 +244,7 @@ class Select(Query):
 
     def distinct(self) -> Self:
         """Add DISTINCT modifier to SELECT."""
+        self._cache = None
         self._distinct = True
         return self
 
@@ -193,14 +274,17 @@ class Select(Query):
             User.select().join(Profile, JoinType.LEFT).on(Profile.user_id == User.id)
         ```
         """
+        self._cache = None
 
         if isinstance(table, str):
             table = TABLE_REGISTRY.get(table)
 
         join = SelectJoin(self, table, join_type)
+        if self._joins is None:
+            self._joins = []
         self._joins.append(join)
 
-        if join_type in (JoinType.NATURAL, JoinType.CROSS):
+        if join_type in _JOINS_WITHOUT_ON:
             # For NATURAL or CROSS joins, we don't need an ON condition
             return self
         return join
@@ -217,7 +301,11 @@ class Select(Query):
             User.select().where(User.email.like('%@example.com'))
         ```
         """
-        self._where_conditions.append(condition)
+        self._cache = None
+
+        if self._where_conditions is None:
+            self._where_conditions = []
+        _extend_and_terms(self._where_conditions, condition)
         return self
 
     def group_by(self, *expressions: Union[str, BaseExpression]) -> Self:
@@ -231,17 +319,30 @@ class Select(Query):
             User.select().group_by('department', User.age)
         ```
         """
+        self._cache = None
+
+        if self._group_by_expressions is None:
+            self._group_by_expressions = []
+
         for expr in expressions:
-            if isinstance(expr, str):
-                # Convert string to expression
-                if '.' in expr:
-                    self._group_by_expressions.append(Expression(expr))
-                else:
-                    self._group_by_expressions.append(Expression(f"{self.table.Meta.table_name}.{expr}"))
+            expr_type = type(expr)
+            if expr_type is str or (expr_type is not ColumnInfo and isinstance(expr, str)):
+                self._group_by_expressions.append(self._string_expression(expr))
             else:
                 self._group_by_expressions.append(expr)
         return self
 
+    def _string_expression(self, expr: str) -> BaseExpression:
+        """Expression for a 'col' or 'table.col' string given to group_by()/order_by()."""
+        # Columns of this table reuse the column itself and its interned name
+        column = self.table.__pgantics_column_lookup__.get(expr)
+        if column is not None:
+            return column
+
+        if '.' in expr:
+            return RawExpression(expr)
+        return RawExpression(f"{self.table.__pgantics_table_name__}.{expr}")
+
     def having(self, condition: BaseExpression) -> Self:
         """Add HAVING condition (used with GROUP BY).
         
@@ -253,6 +354,10 @@ class Select(Query):
             User.select().group_by('department').having(func.Count() > 5)
         ```
         """
+        self._cache = None
+
+        if self._having_conditions is None:
+            self._having_conditions = []
         self._having_conditions.append(condition)
         return self
 
@@ -269,21 +374,14 @@ class Select(Query):
             User.select().order_by(User.name.asc(), User.age.desc())
         ```
         """
+        self._cache = None
+
+        if self._order_by_expressions is None:
+            self._order_by_expressions = []
+
         for expr in expressions:
-            if isinstance(expr, OrderExpression):
-                self._order_by_expressions.append(expr)
-            elif isinstance(expr, str):
-                # Convert string to ascending order expression
-                if '.' in expr:
-                    base_expr = Expression(expr)
-                else:
-                    base_expr = Expression(f"{self.table.Meta.table_name}.{expr}")
-                self._order_by_expressions.append(base_expr.asc())
-            elif isinstance(expr, Expression):
-                # Default to ascending order
-                self._order_by_expressions.append(expr.asc())
-            else:
-                raise TypeError(f"Invalid order expression type: {type(expr)}")
+            handler = _ORDER_BY_HANDLERS.get(type(expr)) or _order_by_handler(type(expr))
+            self._order_by_expressions.append(handler(self, expr))
         return self
 
     def limit(self, count: int) -> Self:
@@ -297,6 +395,8 @@ class Select(Query):
             User.select().limit(10)
         ```
         """
+        self._cache = None
+
         if count < 0:
             raise ValueError("LIMIT count must be non-negative")
         self._limit_value = count
@@ -313,6 +413,8 @@ class Select(Query):
             User.select().offset(20)
         ```
         """
+        self._cache = None
+
         if count < 0:
             raise ValueError("OFFSET count must be non-negative")
         self._offset_value = count
@@ -320,10 +422,13 @@ class Select(Query):
 
     def count(self) -> Self:
         """Convert query to COUNT(*) query."""
-        self._select_columns = [Expression("COUNT(*)")]
+        self._cache = None
+        self._select_columns = [RawExpression("COUNT(*)")]
         return self
     
 class SelectJoin[Q: Select]:
+    __slots__ = ('query', 'table', 'join_type', 'on_condition', '_join_sql', '_needs_on')
+
     def __init__(self, query: Q, table: Type['Table'], join_type: JoinType):
         self.query = query
 
@@ -331,19 +436,21 @@ class SelectJoin[Q: Select]:
         self.join_type = join_type
         self.on_condition: Optional[BaseExpression] = None
 
-    def _build(self) -> Tuple[str, List[Any]]:
-        """Build the JOIN SQL clause."""
+        # Everything before the ON condition is fixed once the join is created
+        self._join_sql = f"{JOIN_TYPE_SQL[join_type]} JOIN {table.__pgantics_table_name__}"
+        self._needs_on = join_type not in _JOINS_WITHOUT_ON
+
+    def _build_into(self, out_params: List[Any]) -> str:
+        """Build the JOIN SQL clause, adding its params to `out_params`."""
 
-        if self.join_type in (JoinType.NATURAL, JoinType.CROSS):
+        if not self._needs_on:
             # For NATURAL or CROSS joins, we don't need an ON condition
-            return f"{self.join_type.value} JOIN {self.table.Meta.table_name}", []
+            return self._join_sql
 
         if self.on_condition is None:
-            raise ValueError(f"JOIN with {self.table.Meta.table_name} is missing ON condition")
+            raise ValueError(f"JOIN with {self.table.__pgantics_table_name__} is missing ON condition")
         
-        condition_sql, params = self.on_condition.build()
-        sql = f"{self.join_type.value} JOIN {self.table.Meta.table_name} ON {condition_sql}"
-        return sql, params
+        return f"{self._join_sql} ON {self.on_condition._build_into(out_params)}"
 
     def on(self, condition: BaseExpression) -> Q:
         """Specify the JOIN condition.
@@ -361,4 +468,5 @@ class SelectJoin[Q: Select]:
         ```
         """
         self.on_condition = condition
+        self.query._cache = None
         return self.query
\ No newline at end of file
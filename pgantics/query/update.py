@@ -1,18 +1,64 @@
+import functools
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Self, Tuple, Type, Union
 
 from ..entities.column import ColumnInfo
 from ..entities.expression import BaseExpression, to_expression
 from ..registry import TABLE_REGISTRY
-from .base import Query
+from .base import Query, own_column_name, resolve_column, row_reader
 
 if TYPE_CHECKING:
     from ..entities.table import Table
 
 __all__ = ["Update"]
 
+# Value types that always bind as a plain `%s`, checked before probing for the expression marker
+_PLAIN_VALUE_TYPES = frozenset((int, float, str, bool))
+
+@functools.lru_cache(maxsize=4096)
+def _update_columns(table: Type['Table'], columns: Optional[Tuple[str, ...]]) -> Tuple[str, ...]:
+    """The columns to SET, in `model_dump()` order. None means all non-primary key columns."""
+    if columns is None:
+        return table.__pgantics_non_pk_columns__
+    return tuple(col for col in table.__pgantics_all_columns__ if col in columns)
+
+@functools.lru_cache(maxsize=512)
+def _update_skeleton(
+    table_name: str,
+    from_tables: Tuple[str, ...],
+    returning: Optional[Tuple[str, ...]],
+) -> Tuple[str, str, str]:
+    """Render the static pieces of an UPDATE: the head, the FROM clause and the RETURNING clause.
+    Optional clauses are empty strings, and carry their leading space otherwise."""
+    from_sql = f" FROM {', '.join(from_tables)}" if from_tables else ""
+
+    returning_sql = ""
+    if returning:
+        if '*' in returning:
+            returning_sql = " RETURNING *"
+        else:
+            returning_sql = f" RETURNING {', '.join(returning)}"
+
+    return f"UPDATE {table_name} ", from_sql, returning_sql
+
+@functools.lru_cache(maxsize=1024)
+def _set_clause(table: Type['Table'], columns: Tuple[str, ...]) -> str:
+    """SET clause binding every column to a placeholder, e.g. `SET a = %s, b = %s`."""
+    fields = table.__pgantics_fields__
+    return "SET " + ", ".join([fields[col]._set_fragment for col in columns])
+
+def _override_column(table: Type['Table'], key: Union[str, ColumnInfo]) -> str:
+    """Field name an override key refers to."""
+    if isinstance(key, str):
+        return own_column_name(table, key)
+    elif isinstance(key, ColumnInfo):
+        return own_column_name(table, key._source_field)
+    raise TypeError(f"Expected string or ColumnInfo key, got {type(key).__name__}")
+
 class Update(Query):
     """SQL UPDATE query builder focused on Pydantic model instances."""
 
+    __slots__ = ('table', '_columns', '_overrides', '_joins', '_where_conditions', '_returning')
+
     def __init__(self, table: 'Table'):
         self.table = table
 
@@ -25,66 +71,59 @@ class Update(Query):
 
     def build(self) -> Tuple[str, List[Any]]:
         params = []
-        
-        if self._columns:
-            # Only include specified columns
-            model_data = self.table.model_dump(mode='json', include=set(self._columns))
+
+        table = type(self.table)
+        columns = _update_columns(table, tuple(self._columns) if self._columns else None)
+
+        # Read the values straight off the instance, unless the model customizes serialization
+        read = row_reader(table, columns)
+        if read is not None:
+            model_data = dict(zip(columns, read(self.table)))
         else:
-            # Include all columns except primary keys by default
-            pks = {k for k, v in self.table.__pgantics_fields__.items() if v.sql_data.get('primary_key', False)}
-            model_data = self.table.model_dump(mode='json', exclude=pks)
-            
-        model_data.update(self._overrides)
-        
-        
+            model_data = self.table.model_dump(mode='json', include=set(columns))
+
+        model_data |= self._overrides
+
         if not model_data:
             raise ValueError("No columns found to update")
 
-        # Build the main UPDATE statement
-        sql_parts = [f"UPDATE {self.table.Meta.table_name}"]
-        
-        # SET clause
-        set_clauses = []
-        for col, val in model_data.items():
-            if not isinstance(val, BaseExpression):
-                val = to_expression(val)
-
-            val_sql, val_params = val.build()
-            set_clauses.append(f"{col} = {val_sql}")
-            params.extend(val_params)
-        
-        sql_parts.append(f"SET {', '.join(set_clauses)}")
-        
-        # FROM clause (for JOINs)
-        if self._joins:
-            from_tables = [join.table.Meta.table_name for join in self._joins]
-            sql_parts.append(f"FROM {', '.join(from_tables)}")
-            
-            # Add all JOIN conditions to WHERE clause
-            for join in self._joins:
-                if join.on_condition:
-                    self._where_conditions.append(join.on_condition)
-        
-        # WHERE clause
-        if self._where_conditions:
-            where_sqls = []
-            for condition in self._where_conditions:
-                cond_sql, cond_params = condition.build()
-                where_sqls.append(f"({cond_sql})")
-                params.extend(cond_params)
-            sql_parts.append(f"WHERE {' AND '.join(where_sqls)}")
+        head, from_sql, returning_sql = _update_skeleton(
+            table.__pgantics_table_name__,
+            tuple(join.table.__pgantics_table_name__ for join in self._joins),
+            tuple(self._returning) if self._returning else None,
+        )
+
+        # SET clause, plain values all bind as `%s` so the clause only depends on the columns
+        values = model_data.values()
+        if any(
+            type(val) not in _PLAIN_VALUE_TYPES and (val is None or getattr(val, '_is_expression', False))
+            for val in values
+        ):
+            fields = table.__pgantics_fields__
+            set_clauses = []
+            for col, val in model_data.items():
+                if type(val) not in _PLAIN_VALUE_TYPES and (val is None or getattr(val, '_is_expression', False)):
+                    set_clauses.append(f"{col} = {to_expression(val)._build_into(params)}")
+                else:
+                    # Plain values bind directly, no expression wrapper needed
+                    set_clauses.append(fields[col]._set_fragment)
+                    params.append(val)
+            set_sql = f"SET {', '.join(set_clauses)}"
         else:
+            set_sql = _set_clause(table, tuple(model_data))
+            params.extend(values)
+
+        # WHERE clause, JOIN conditions are ANDed in after the query's own conditions
+        conditions = self._where_conditions + [join.on_condition for join in self._joins if join.on_condition]
+        if not conditions:
             # Safety check - require WHERE clause to prevent accidental full table update
             raise ValueError("UPDATE query must include a WHERE clause. If you want to update a full table, use .where(pgantics.literal(True))")
-        
-        # RETURNING clause
-        if self._returning:
-            if '*' in self._returning:
-                sql_parts.append("RETURNING *")
-            else:
-                sql_parts.append(f"RETURNING {', '.join(self._returning)}")
 
-        return " ".join(sql_parts), params
+        # Each condition renders straight into params, so the clause is a single join
+        where_sql = ") AND (".join([condition._build_into(params) for condition in conditions])
+
+        # Every clause is known by now, so the statement is a single format
+        return f"{head}{set_sql}{from_sql} WHERE ({where_sql}){returning_sql}", params
 
     def update(self, *columns: Union[str, ColumnInfo]) -> Self:
         """Specify columns to update.
@@ -104,52 +143,37 @@ class Update(Query):
 
         self._columns = []
 
+        table = type(self.table)
         for col in columns:
             if isinstance(col, str):
-                # Handle string column names
-                if '.' in col:
-                    table_name, column = col.split('.', 1)
-                    table = TABLE_REGISTRY.get(table_name)
-                else:
-                    table = self.table
-                    column = col
-
-                if column not in table.__pgantics_fields__:
-                    raise ValueError(f"Column '{column}' does not exist in table '{table.Meta.table_name}'")
-                col = table.__pgantics_fields__[column]
+                col = resolve_column(table, col)
 
             self._columns.append(col._source_field)
 
         return self
     
-    def override(self, updates: Dict[Union[str, ColumnInfo], Any]) -> Self:
+    def override(self, updates: Optional[Dict[Union[str, ColumnInfo], Any]] = None, /, **columns: Any) -> Self:
         """Override specific columns with new values.
 
         Args:
             updates: Dictionary of column names or ColumnInfo objects to their new values
+            **columns: Column names of this table to their new values
 
         Example:
         ```
             user.update().override({'email': 'new@example.com', 'updated_at': funcs.Now()})
             user.update().override({User.last_login: funcs.Now()})
+            user.update('email').override(updated_at=funcs.Now(), login_count=User.login_count + 1)
         ```
         """
+        if updates is None:
+            updates = columns
+        elif columns:
+            updates = {**updates, **columns}
 
-        for key, val in updates.items():
-            if isinstance(key, ColumnInfo):
-                column_name = key._source_field
-            elif isinstance(key, str):
-                if '.' in key:
-                    _, column_name = key.split('.', 1)
-                else:
-                    column_name = key
-            else:
-                raise TypeError(f"Expected string or ColumnInfo key, got {type(key).__name__}")
-
-            if column_name not in self.table.__pgantics_fields__:
-                raise ValueError(f"Column '{column_name}' does not exist in table '{self.table.Meta.table_name}'")
-
-            self._overrides[column_name] = val
+        # Validate every key before touching the overrides, then merge them in one go
+        table = type(self.table)
+        self._overrides |= {_override_column(table, key): val for key, val in updates.items()}
 
         return self
     
@@ -208,28 +232,26 @@ class Update(Query):
             return self
 
         self._returning = []
+
+        table = type(self.table)
         for col in columns:
             if isinstance(col, str):
                 if col == '*':
                     self._returning = ['*']
                     return self
-                elif '.' in col:
-                    _, column = col.split('.', 1)
-                else:
-                    column = col
+                column = own_column_name(table, col)
             elif isinstance(col, ColumnInfo):
-                column = col._source_field
+                column = own_column_name(table, col._source_field)
             else:
                 raise TypeError(f"Expected string or ColumnInfo, got {type(col).__name__}")
 
-            if column not in self.table.__pgantics_fields__:
-                raise ValueError(f"Column '{column}' does not exist in table '{self.table.Meta.table_name}'")
-
             self._returning.append(column)
 
         return self
     
 class UpdateJoin[Q: Update]:
+    __slots__ = ('query', 'table', 'on_condition')
+
     def __init__(self, query: Q, table: Type['Table']):
         self.query = query
         self.table = table
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from .types import PostgresType
 
 class Register[C]:
+    __slots__ = ('registry_type', '_registry')
+
     def __init__(self, registry_type: str):
         self.registry_type = registry_type
         self._registry: Dict[str, Type[C]] = {}
@@ -24,6 +26,18 @@ class Register[C]:
         return cls
 
 class TableRegister(Register['Table']):
+    __slots__ = ('_by_table_name',)
+
+    def __init__(self, registry_type: str):
+        super().__init__(registry_type)
+        self._by_table_name: Dict[str, Type['Table']] = {}
+
+    def register(self, cls: Type['Table']):
+        super().register(cls)
+
+        # The first table registered under a name wins, as with a scan in registration order
+        self._by_table_name.setdefault(cls.Meta.table_name, cls)
+
     def get(self, cls_name: str) -> Type['Table']:
         cls = self._registry.get(cls_name)
 
@@ -32,12 +46,14 @@ class TableRegister(Register['Table']):
         return cls
 
     def get_by_name(self, table_name: str) -> Type['Table']:
-        cls = next((cls for cls in self._registry.values() if cls.Meta.table_name == table_name), None)
+        cls = self._by_table_name.get(table_name)
         if cls is None:
             raise NotRegisteredError(f"Table class with name '{table_name}' is not registered.")
         return cls
 
 class TypeRegister(Register['PostgresType']):
+    __slots__ = ()
+
     @overload
     def get(self, cls_name: Literal['CompositeType']) -> Type['CompositeType']:
         ...
@@ -1,3 +1,4 @@
+import sys
 from abc import ABC
 from typing import TYPE_CHECKING, Type
 
@@ -14,12 +15,21 @@ class PostgresType(ABC):
     _source_table: Type['Table']
     _source_field: str
 
+    # SQL spelling of the type, the upper-cased class name unless a subclass sets it
+    _sql_name: str
+
     def __init__(self):
         pass
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
+
+        if '_sql_name' not in cls.__dict__:
+            cls._sql_name = sys.intern(cls.__name__.upper())
         TYPE_REGISTRY.register(cls)
 
+    def __str__(self) -> str:
+        return self._sql_name
+
     def __repr__(self):
         return f"<{self.__class__.__name__} value={super().__repr__()}>"
\ No newline at end of file
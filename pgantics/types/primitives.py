@@ -24,9 +24,6 @@ class Boolean(PostgresType):
         has_premium: Mapped[bool] = Column(types.Boolean(), postgres_default=default.Bool(False))
     """
 
-    def __str__(self):
-        return "BOOLEAN"
-
 class SmallInt(PostgresType):
     """Postgres SMALLINT type. (-32768 to 32767)
 
@@ -37,9 +34,6 @@ class SmallInt(PostgresType):
         # With default
         age: Mapped[int] = Column(types.SmallInt(), postgres_default=default.Int(18))
     """
-
-    def __str__(self):
-        return "SMALLINT"
     
 class Integer(PostgresType):
     """Postgres INTEGER type. (-2147483648 to 2147483647)
@@ -52,9 +46,6 @@ class Integer(PostgresType):
         age: Mapped[int] = Column(types.Integer(), postgres_default=default.Int(18))
     """
 
-    def __str__(self):
-        return "INTEGER"
-
 class BigInt(PostgresType):
     """Postgres BIGINT type. (-9223372036854775808 to 9223372036854775807)
 
@@ -62,9 +53,6 @@ class BigInt(PostgresType):
         # Basic
         id: Mapped[int] = Column(types.BigInt())
     """
-
-    def __str__(self):
-        return "BIGINT"
     
 class Real(PostgresType):
     """Postgres REAL type. (Single precision floating point)
@@ -77,9 +65,6 @@ class Real(PostgresType):
         price: Mapped[float] = Column(types.Real(), postgres_default=default.Float(19.99))
     """
 
-    def __str__(self):
-        return "REAL"
-
 class SmallSerial(PostgresType):
     """Postgres SMALLSERIAL type. (1 to 32767)
 
@@ -88,9 +73,6 @@ class SmallSerial(PostgresType):
         item_id: Mapped[int] = Column(types.SmallSerial())
     """
 
-    def __str__(self):
-        return "SMALLSERIAL"
-
 class Serial(PostgresType):
     """Postgres SERIAL type. (1 to 2147483647)
 
@@ -99,9 +81,6 @@ class Serial(PostgresType):
         user_id: Mapped[int] = Column(types.Serial())
     """
 
-    def __str__(self):
-        return "SERIAL"
-
 class BigSerial(PostgresType):
     """Postgres BIGSERIAL type. (1 to 9223372036854775807)
 
@@ -109,9 +88,6 @@ class BigSerial(PostgresType):
         # Basic
         order_id: Mapped[int] = Column(types.BigSerial())
     """
-
-    def __str__(self):
-        return "BIGSERIAL"
     
 class __string(PostgresType):
     _min = 1
@@ -123,11 +99,9 @@ class __string(PostgresType):
         self.length = length
 
     def __str__(self):
-        type = self.__class__.__name__.upper()
-
         if self.length is not None:
-            return f"{type}({self.length})"
-        return type
+            return f"{self._sql_name}({self.length})"
+        return self._sql_name
 
 class Char(__string):
     """Postgres CHAR type. Fixed-length character type.
@@ -177,11 +151,9 @@ class Timestamp(PostgresType):
         self.precision = precision
 
     def __str__(self):
-        type = self.__class__.__name__.upper()
-
         if self.precision is not None:
-            return f"{type}({self.precision})"
-        return type
+            return f"{self._sql_name}({self.precision})"
+        return self._sql_name
 
 class TimestampTZ(PostgresType):
     """Postgres TIMESTAMPTZ type. Represents a point in time with time zone.
@@ -1,18 +1,21 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Sequence, Tuple
 
 if TYPE_CHECKING:
     from .query.base import Query
 
 __all__ = [
     "MISSING",
-    "format_query"
+    "format_build",
+    "format_query",
+    "freeze",
+    "FrozenQuery"
 ]
 
 class __Missing:
     __slots__ = ()
 
     def __eq__(self, other) -> bool:
-        return False
+        return other is self or NotImplemented
 
     def __bool__(self) -> bool:
         return False
@@ -22,15 +25,93 @@ class __Missing:
 
     def __repr__(self):
         return '...'
+
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference to the module-level singleton
+        return 'MISSING'
     
 MISSING: Any = __Missing()
 
+_PLACEHOLDER_CACHE: Dict[int, str] = {}
+_PLACEHOLDER_CACHE_LIMIT = 1000
+
+def placeholders(n: int, /) -> str:
+    """Return `n` comma separated `%s` placeholders, cached per length for common sizes."""
+    cached = _PLACEHOLDER_CACHE.get(n)
+    if cached is None:
+        # String repetition avoids building an n-item list just to join it
+        cached = '%s, ' * (n - 1) + '%s' if n > 0 else ''
+        if n <= _PLACEHOLDER_CACHE_LIMIT:
+            _PLACEHOLDER_CACHE[n] = cached
+    return cached
+
+def format_build(sql: str, params: Sequence[Any], /) -> str:
+    """
+    Format built SQL with its parameters for display. This is NOT meant to be used for actual query execution.
+    """
+    # Split once and interleave, rather than rescanning the string for every param
+    parts = sql.split("%s", len(params))
+    out = [parts[0]]
+    for param, part in zip(params, parts[1:]):
+        out.append(repr(param))
+        out.append(part)
+    return "".join(out)
+
 def format_query(query: 'Query', /) -> str:
     """
     Format SQL query with parameters for display. This is NOT meant to be used for actual query execution.
     """
-    sql, params = query.build()
+    return format_build(*query.build())
+
+class FrozenQuery:
+    """A query rendered once. Calling it returns the SQL and a fresh params list,
+    with `param()` placeholders replaced by the matching keyword arguments."""
+
+    __slots__ = ('sql', 'params', 'names', '_slots')
+
+    def __init__(self, sql: str, params: Sequence[Any]):
+        from .entities.expression import ParamExpression
+
+        self.sql = sql
+        self.params: Tuple[Any, ...] = tuple(params)
+
+        # Positions in params that get a value per call
+        self._slots: Tuple[Tuple[int, str], ...] = tuple(
+            (index, value.name) for index, value in enumerate(self.params) if isinstance(value, ParamExpression)
+        )
+        self.names: FrozenSet[str] = frozenset(name for _, name in self._slots)
+
+    def __call__(self, **values: Any) -> Tuple[str, List[Any]]:
+        if values.keys() != self.names:
+            missing = self.names - values.keys()
+            if missing:
+                raise TypeError(f"Missing values for params: {', '.join(sorted(missing))}")
+            raise TypeError(f"Unexpected params: {', '.join(sorted(values.keys() - self.names))}")
+
+        params = list(self.params)
+        for index, name in self._slots:
+            params[index] = values[name]
+        return self.sql, params
+
+    def __repr__(self) -> str:
+        return f"<FrozenQuery sql={self.sql!r}>"
+
+def freeze(query: 'Query', /) -> FrozenQuery:
+    """
+    Build a query once, for a statement that runs many times with different values.
+
+    Example:
+    ```
+        by_age = freeze(User.select().where(User.age > param('min_age')))
+
+        sql, params = by_age(min_age=18)
+        await database.fetch_many(sql, params)
+    ```
+    """
+    from .entities.expression import _FREEZING
 
-    for param in params:
-        sql = sql.replace("%s", repr(param), 1)
-    return sql
\ No newline at end of file
+    token = _FREEZING.set(True)
+    try:
+        return FrozenQuery(*query.build())
+    finally:
+        _FREEZING.reset(token)
\ No newline at end of file
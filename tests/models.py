@@ -0,0 +1,55 @@
+import datetime
+import enum
+from typing import Optional
+
+from pydantic import ConfigDict
+
+from pgantics import Column, Mapped, Table, types
+
+
+class User(Table):
+    class Meta:
+        table_name = "users"
+
+    id: Mapped[int] = Column(types.BigSerial(), primary_key=True)
+    name: Mapped[str] = Column(types.VarChar(100))
+    email: Mapped[str] = Column(types.VarChar(100))
+    age: Mapped[int] = Column(types.Integer())
+    created_at: Mapped[datetime.datetime] = Column(types.TimestampTZ())
+
+class LegacyUser(Table):
+    class Meta:
+        table_name = "legacy_users"
+
+    id: Mapped[int] = Column(types.BigSerial(), primary_key=True)
+    full_name: Mapped[str] = Column(types.VarChar(100))
+    email_address: Mapped[str] = Column(types.VarChar(100))
+    active: Mapped[bool] = Column(types.Boolean())
+
+class Job(Table):
+    model_config = ConfigDict(ser_json_timedelta='float')
+
+    class Meta:
+        table_name = "jobs"
+
+    id: Mapped[int] = Column(types.BigSerial(), primary_key=True)
+    duration: Mapped[datetime.timedelta] = Column(types.Real())
+
+class Kind(enum.Enum):
+    START = 'start'
+    STOP = 'stop'
+
+class Event(Table):
+    class Meta:
+        table_name = "events"
+
+    id: Mapped[int] = Column(types.BigInt(), primary_key=True)
+    kind: Mapped[Kind] = Column(types.Text())
+    at: Mapped[datetime.datetime] = Column(types.Timestamp())
+
+class Note(Table):
+    class Meta:
+        table_name = "notes"
+
+    id: Mapped[int] = Column(types.BigSerial(), primary_key=True)
+    body: Mapped[Optional[str]] = Column(types.Text(), default=None, exclude_if=lambda v: v is None)
@@ -0,0 +1,7 @@
+from .models import Note, User
+
+
+def test_repr_shows_field_settings_only():
+    assert repr(User.id) == "ColumnInfo(annotation=int, required=True)"
+    assert repr(Note.body).startswith("ColumnInfo(annotation=Union[str, NoneType], required=False, default=None, ")
+    assert '_qualified' not in repr(Note.body)
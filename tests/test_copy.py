@@ -0,0 +1,81 @@
+import datetime
+import struct
+
+import pytest
+
+from .models import Event, Job, Kind
+
+_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+
+
+def decode_rows(payload):
+    """Split a binary COPY stream into rows of raw cell bytes (None for NULL)."""
+    data = b''.join(payload)
+    assert data.startswith(_HEADER)
+    assert data.endswith(struct.pack('!h', -1))
+
+    rows, pos = [], len(_HEADER)
+    while True:
+        (count,) = struct.unpack_from('!h', data, pos)
+        pos += 2
+        if count == -1:
+            return rows
+
+        row = []
+        for _ in range(count):
+            (size,) = struct.unpack_from('!i', data, pos)
+            pos += 4
+            if size == -1:
+                row.append(None)
+            else:
+                row.append(data[pos:pos + size])
+                pos += size
+        rows.append(row)
+
+
+def decode_timestamp(cell):
+    (micros,) = struct.unpack('!q', cell)
+    return datetime.datetime(2000, 1, 1) + datetime.timedelta(microseconds=micros)
+
+
+def test_copy_uses_table_serialization_config():
+    job = Job(id=1, duration=datetime.timedelta(seconds=90))
+    sql, payload = Job.bulk_insert([job]).build_copy()
+
+    assert sql == "COPY jobs (id, duration) FROM STDIN WITH (FORMAT BINARY)"
+    assert Job.bulk_insert([job]).build()[1] == [1, 90.0]
+
+    [[id_cell, duration_cell]] = decode_rows(payload)
+    assert struct.unpack('!q', id_cell) == (1,)
+    assert struct.unpack('!f', duration_cell) == (90.0,)
+
+
+def test_copy_encodes_enum_values_and_drops_timestamp_offset():
+    tz = datetime.timezone(datetime.timedelta(hours=5))
+    events = [
+        Event(id=1, kind=Kind.START, at=datetime.datetime(2024, 1, 1, tzinfo=tz)),
+        Event(id=2, kind=Kind.STOP, at=datetime.datetime(2024, 1, 1, 12, 30)),
+    ]
+    _, payload = Event.bulk_insert(events).build_copy()
+
+    rows = decode_rows(payload)
+    assert [row[1] for row in rows] == [b'start', b'stop']
+    # Same wall time the VALUES path stores for a plain TIMESTAMP column
+    assert [decode_timestamp(row[2]) for row in rows] == [
+        datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 12, 30),
+    ]
+
+
+def test_copy_encodes_overrides_once_for_every_row():
+    events = [Event(id=i, kind=Kind.START, at=datetime.datetime(2024, 1, 1)) for i in (1, 2)]
+    _, payload = Event.bulk_insert(events).override(kind='stop').build_copy()
+
+    assert [row[1] for row in decode_rows(payload)] == [b'stop', b'stop']
+
+
+def test_copy_rejects_values_the_column_type_cant_encode():
+    events = [Event(id=1, kind=Kind.START, at=datetime.datetime(2024, 1, 1))]
+    _, payload = Event.bulk_insert(events).override(kind=Kind.STOP).build_copy()
+
+    with pytest.raises(TypeError, match="Column 'kind' value"):
+        b''.join(payload)
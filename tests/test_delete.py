@@ -0,0 +1,25 @@
+from pgantics import case
+
+from .models import User
+
+
+def test_case_mutated_after_build_is_rendered_again():
+    grouping = case().when(User.age < 18, 'minor')
+    query = User.delete().where(grouping == 'minor')
+    assert query.build() == ("DELETE FROM users WHERE (CASE WHEN users.age < %s THEN %s END = %s)", [18, 'minor', 'minor'])
+
+    grouping.else_('adult')
+    assert query.build() == (
+        "DELETE FROM users WHERE (CASE WHEN users.age < %s THEN %s ELSE %s END = %s)",
+        [18, 'minor', 'adult', 'minor'],
+    )
+
+
+def test_returning_keeps_qualified_star():
+    query = User.delete().where(User.id == 1).returning('users.*')
+    assert query.build() == ("DELETE FROM users WHERE (users.id = %s) RETURNING users.*", [1])
+
+
+def test_returning_bare_star():
+    query = User.delete().where(User.id == 1).returning('id', '*')
+    assert query.build() == ("DELETE FROM users WHERE (users.id = %s) RETURNING *", [1])
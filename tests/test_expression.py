@@ -0,0 +1,11 @@
+from pgantics import case
+
+from .models import User
+
+
+def test_repr_of_unbuildable_expression():
+    assert repr(case()) == "CaseExpression(<unbuildable>)"
+
+
+def test_repr_of_buildable_expression():
+    assert repr(case().when(User.age < 18, 'minor')) == "CaseExpression(CASE WHEN users.age < %s THEN %s END)"
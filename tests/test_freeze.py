@@ -0,0 +1,50 @@
+import pytest
+
+from pgantics import format_query, freeze, param
+
+from .models import User
+
+
+def test_frozen_query_substitutes_every_slot():
+    frozen = freeze(User.select('id').where((User.age > param('min_age')) & (User.name == param('name'))))
+    assert frozen.names == {'min_age', 'name'}
+
+    sql, params = frozen(min_age=18, name='Ann')
+    assert sql == "SELECT users.id FROM users WHERE (users.age > %s) AND (users.name = %s)"
+    assert params == [18, 'Ann']
+
+    # Each call gets its own list
+    assert frozen(min_age=30, name='Bob')[1] == [30, 'Bob']
+    assert params == [18, 'Ann']
+
+
+def test_frozen_query_keeps_plain_params():
+    frozen = freeze(User.delete().where((User.id == param('id')) & (User.age < 18)))
+    assert frozen(id=5) == ("DELETE FROM users WHERE ((users.id = %s) AND (users.age < %s))", [5, 18])
+
+
+def test_frozen_query_rejects_missing_names():
+    frozen = freeze(User.select('id').where(User.age > param('min_age')))
+    with pytest.raises(TypeError, match="Missing values for params: min_age"):
+        frozen()
+
+
+def test_frozen_query_rejects_unexpected_names():
+    frozen = freeze(User.select('id').where(User.age > param('min_age')))
+    with pytest.raises(TypeError, match="Unexpected params: max_age"):
+        frozen(min_age=18, max_age=65)
+
+
+def test_unbound_param_is_rejected_outside_freeze():
+    query = User.select('id').where(User.id == param('x'))
+    with pytest.raises(ValueError, match=r"param\('x'\) is unbound"):
+        query.build()
+    with pytest.raises(ValueError, match=r"param\('x'\) is unbound"):
+        format_query(query)
+
+
+def test_freeze_result_is_not_reused_by_build():
+    query = User.select('id').where(User.id == param('x'))
+    freeze(query)
+    with pytest.raises(ValueError, match="unbound"):
+        query.build()
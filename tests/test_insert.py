@@ -0,0 +1,72 @@
+import datetime
+
+import pytest
+
+from pgantics import funcs
+
+from .models import Job, LegacyUser, Note, User
+
+
+def make_user() -> User:
+    return User(id=1, name="Ann", email="ann@example.com", age=30, created_at="2024-01-02T03:04:05")
+
+def test_from_select_keeps_column_order():
+    # Deliberately not in model order, each column must line up with the SELECT list
+    query = make_user().insert('email', 'name').from_select(
+        LegacyUser.select('email_address', 'full_name').where(LegacyUser.active == True)
+    )
+    sql, params = query.build()
+
+    assert sql == (
+        "INSERT INTO users (email, name) "
+        "SELECT legacy_users.email_address, legacy_users.full_name FROM legacy_users WHERE legacy_users.active = %s"
+    )
+    assert params == [True]
+
+def test_values_follow_model_order():
+    sql, params = make_user().insert('email', 'name').build()
+
+    assert sql == "INSERT INTO users (name, email) VALUES (%s, %s)"
+    assert params == ["Ann", "ann@example.com"]
+
+def test_values_use_table_serialization_config():
+    job = Job(id=1, duration=datetime.timedelta(seconds=90))
+    _, params = job.insert().build()
+
+    assert params == [1, 90.0]
+    assert params == list(job.model_dump(mode='json').values())
+
+
+def test_expression_override_renders_inline():
+    query = make_user().insert('id', 'created_at').override(created_at=funcs.Now())
+    assert query.build() == ("INSERT INTO users (id, created_at) VALUES (%s, NOW())", [1])
+
+
+def test_expression_override_params_stay_in_row_order():
+    user = make_user()
+    query = User.bulk_insert([user, user]).insert('id', 'name').override(name=funcs.Lower('ANN'))
+    assert query.build() == (
+        "INSERT INTO users (id, name) VALUES (%s, LOWER(%s)), (%s, LOWER(%s))",
+        [1, 'ANN', 1, 'ANN'],
+    )
+    assert query.build_many() == ("INSERT INTO users (id, name) VALUES (%s, LOWER(%s))", [(1, 'ANN'), (1, 'ANN')])
+
+
+def test_values_respect_exclude_if():
+    assert Note(id=1).insert().build() == ("INSERT INTO notes (id) VALUES (%s)", [1])
+    assert Note(id=1, body='hi').insert().build() == ("INSERT INTO notes (id, body) VALUES (%s, %s)", [1, 'hi'])
+
+
+def test_build_many_appends_conflict_params_to_every_row():
+    users = [make_user(), User(id=2, name="Bob", email="bob@example.com", age=40, created_at="2024-01-02T03:04:05")]
+    query = User.bulk_insert(users).insert('id', 'name').on_conflict('id').do_update({'name': 'x', 'age': User.age + 1})
+    assert query.build_many() == (
+        "INSERT INTO users (id, name) VALUES (%s, %s) ON CONFLICT (id) DO UPDATE SET name = %s, age = (users.age + %s)",
+        [(1, 'Ann', 'x', 1), (2, 'Bob', 'x', 1)],
+    )
+
+
+def test_build_many_rejects_returning():
+    query = User.bulk_insert([make_user()]).returning('id')
+    with pytest.raises(ValueError, match="executemany"):
+        query.build_many()
@@ -0,0 +1,27 @@
+from pgantics import case
+
+from .models import User
+
+
+def test_case_mutated_after_build_is_rendered_again():
+    grouping = case().when(User.age < 18, 'minor')
+    query = User.select(grouping)
+    assert query.build() == ("SELECT CASE WHEN users.age < %s THEN %s END FROM users", [18, 'minor'])
+
+    grouping.else_('adult')
+    assert query.build() == ("SELECT CASE WHEN users.age < %s THEN %s ELSE %s END FROM users", [18, 'minor', 'adult'])
+
+def test_case_in_where_mutated_after_build_is_rendered_again():
+    grouping = case().when(User.age < 18, 'minor')
+    query = User.select().where(grouping == 'minor')
+    query.build()
+
+    grouping.when(User.age < 65, 'adult')
+    sql, params = query.build()
+    assert sql == "SELECT * FROM users WHERE CASE WHEN users.age < %s THEN %s WHEN users.age < %s THEN %s END = %s"
+    assert params == [18, 'minor', 65, 'adult', 'minor']
+
+def test_build_is_cached_without_builder_nodes():
+    query = User.select().where(User.age > 18)
+    assert query.build() == query.build() == ("SELECT * FROM users WHERE users.age > %s", [18])
+    assert query._cache is not None
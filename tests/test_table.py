@@ -0,0 +1,40 @@
+from typing import Optional
+
+import pytest
+
+from pgantics import Table
+
+from .models import User
+
+
+@pytest.mark.parametrize('method', ['insert', 'update'])
+def test_instance_method_called_on_class_raises(method):
+    with pytest.raises(TypeError, match=rf"User\.{method}\(\) must be called on an instance"):
+        getattr(User, method)()
+
+
+def test_instance_method_called_on_instance_builds():
+    user = User(id=1, name='Ann', email='ann@example.com', age=30, created_at='2024-01-02T03:04:05')
+    assert user.insert().build()[0].startswith("INSERT INTO users")
+
+
+
+def test_optional_meta_attrs_are_not_required():
+    class Tenanted(Table):
+        class Meta:
+            table_name = "tenanted"
+            schema: Optional[str]
+            tablespace: str | None
+
+    class Account(Tenanted):
+        class Meta:
+            table_name = "accounts"
+
+    assert Account.Meta.table_name == "accounts"
+
+
+def test_required_meta_attrs_are_enforced():
+    with pytest.raises(TypeError, match="missing required Meta attribute 'table_name'"):
+        class Nameless(Table):
+            class Meta:
+                pass
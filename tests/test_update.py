@@ -0,0 +1,11 @@
+import datetime
+
+from .models import Job
+
+
+def test_set_values_use_table_serialization_config():
+    job = Job(id=1, duration=datetime.timedelta(seconds=90))
+    sql, params = job.update().where(Job.id == 1).build()
+
+    assert sql == "UPDATE jobs SET duration = %s WHERE (jobs.id = %s)"
+    assert params == [90.0, 1]